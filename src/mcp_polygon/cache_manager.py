@@ -703,12 +703,44 @@ class CacheManager:
         # Rule 5: Default to direct return for small, one-off queries
         return False
 
+    @staticmethod
+    def _to_table(
+        rows: List[Dict[str, Any]], schema: Optional[Dict[str, pa.DataType]] = None
+    ) -> pa.Table:
+        """
+        Build an Arrow table from CSV rows, typing the columns in schema.
+
+        CSV rows carry every value as a string, which would otherwise be
+        stored as VARCHAR and re-cast by DuckDB on every query.
+
+        Args:
+            rows: Rows parsed from CSV (column -> string value)
+            schema: Optional numeric types for known columns; columns not
+                present in the rows are ignored, empty values become null
+        """
+        df = pd.DataFrame(rows)
+        table = pa.Table.from_pandas(df)
+        for name, type_ in (schema or {}).items():
+            index = table.schema.get_field_index(name)
+            if index != -1:
+                # Parse into nullable dtypes so a gap in an integer column is
+                # null rather than NaN forcing every value through float64
+                values = pd.to_numeric(
+                    df[name].replace("", None),
+                    errors="coerce",
+                    dtype_backend="numpy_nullable",
+                )
+                column = pa.array(values, type=type_, from_pandas=True)
+                table = table.set_column(index, name, column)
+        return table
+
     def save(
         self,
         tool_name: str,
         params: Dict[str, Any],
         csv_data: str,
         columns: List[str],
+        schema: Optional[Dict[str, pa.DataType]] = None,
     ) -> Dict[str, Any]:
         """
         Save CSV data to Parquet with appropriate partitioning.
@@ -718,6 +750,7 @@ class CacheManager:
             params: Parameters used in the API call
             csv_data: CSV string data
             columns: Column names
+            schema: Optional column types (see _to_table)
 
         Returns:
             Metadata dictionary with cache location and query info
@@ -732,15 +765,13 @@ class CacheManager:
         if not rows:
             raise ValueError("No data to cache")
 
-        df = pd.DataFrame(rows)
-
         # Get partition path
         partition_path, partition_key = self._get_partition_path(tool_name, params)
         partition_path.mkdir(parents=True, exist_ok=True)
 
         # Save to Parquet
         parquet_file = partition_path / "data.parquet"
-        table = pa.Table.from_pandas(df)
+        table = self._to_table(rows, schema)
         pq.write_table(table, parquet_file, compression="snappy")
 
         # Update metadata
@@ -791,6 +822,7 @@ class CacheManager:
         csv_data: str,
         batch_num: int,
         columns: Optional[List[str]] = None,
+        schema: Optional[Dict[str, pa.DataType]] = None,
     ) -> List[Path]:
         """
         Save a batch of CSV data with automatic data-driven partitioning.
@@ -805,6 +837,7 @@ class CacheManager:
             csv_data: CSV string data for this batch
             batch_num: Batch number (0-indexed)
             columns: Optional column names (extracted from first batch)
+            schema: Optional column types (see _to_table)
 
         Returns:
             List of paths to written Parquet files (one per partition)
@@ -826,11 +859,10 @@ class CacheManager:
 
         if not partition_cols:
             # No partitioning defined, use old parameter-based approach
-            df = pd.DataFrame(rows)
             partition_path, partition_key = self._get_partition_path(tool_name, params)
             partition_path.mkdir(parents=True, exist_ok=True)
             parquet_file = partition_path / f"data_{batch_num:03d}.parquet"
-            table = pa.Table.from_pandas(df)
+            table = self._to_table(rows, schema)
             pq.write_table(table, parquet_file, compression="snappy")
             return [parquet_file]
 
@@ -862,9 +894,8 @@ class CacheManager:
                 next_num = 0
 
             # Write partition data
-            df = pd.DataFrame(group_rows)
             parquet_file = partition_path / f"data_{next_num:03d}.parquet"
-            table = pa.Table.from_pandas(df)
+            table = self._to_table(group_rows, schema)
             pq.write_table(table, parquet_file, compression="snappy")
             written_files.append(parquet_file)
 
@@ -5,8 +5,14 @@ import logging
 import warnings
 from importlib.metadata import version, PackageNotFoundError
 
+import requests
 from mcp.server.fastmcp import FastMCP
 from polygon import RESTClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from .utils import POLYGON_MAX_INFLIGHT, record_response_status
 
 # Suppress duplicate tool registration warnings during import
 # These warnings occur because multiple tool modules import poly_mcp,
@@ -38,5 +44,32 @@ except PackageNotFoundError:
 polygon_client = RESTClient(POLYGON_API_KEY)
 polygon_client.headers["User-Agent"] += f" {version_number}"
 
+# Keep one reusable keep-alive connection per in-flight call. urllib3 defaults
+# to maxsize=1 per host, so concurrent worker threads would otherwise open and
+# then discard a fresh TLS connection on every request.
+for _pool_manager in (polygon_client.client, polygon_client.vx.client):
+    _pool_manager.connection_pool_kw["maxsize"] = POLYGON_MAX_INFLIGHT
+    # Lets conditional requests recognise a real 304 Not Modified
+    _pool_manager.request = record_response_status(_pool_manager.request)
+
+# The SDK only advertises gzip. ACCEPT_ENCODING lists every codec urllib3 can
+# decode here (adding br/zstd when brotli/zstandard are installed), so large
+# JSON payloads such as grouped daily bars come back as small as possible.
+for _client in (polygon_client, polygon_client.vx):
+    _client.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+# Shared keep-alive session for the non-Polygon HTTP APIs (Alpha Vantage), so
+# repeat calls reuse the TCP/TLS connection instead of handshaking each time
+http_session = requests.Session()
+http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=POLYGON_MAX_INFLIGHT,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504)
+        ),
+    ),
+)
+
 # Initialize MCP server
 poly_mcp = FastMCP("Polygon", dependencies=["polygon"])
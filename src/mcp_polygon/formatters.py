@@ -1,8 +1,39 @@
+import base64
 import json
 import csv
 import io
+import threading
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.ipc as pa_ipc
+
+# Below this many records Arrow's setup cost outweighs its faster formatting
+COLUMNAR_MIN_ROWS = 1000
+
+# Per-thread scratch buffer reused by json_to_csv. Tools run on the event loop
+# thread and json_to_csv never awaits, so one buffer per thread is enough.
+_csv_buffers = threading.local()
+
+
+def _get_csv_buffer() -> io.StringIO:
+    """
+    Get this thread's reusable CSV output buffer, emptied and rewound.
+
+    Returns:
+        StringIO buffer ready for a new CSV document
+    """
+    buf = getattr(_csv_buffers, "buf", None)
+    if buf is None:
+        buf = _csv_buffers.buf = io.StringIO()
+    buf.seek(0)
+    buf.truncate()
+    return buf
+
 
 def deep_vars(obj: Any) -> Any:
     """
@@ -41,20 +72,189 @@ def deep_vars(obj: Any) -> Any:
     return str(obj)
 
 
-def json_to_csv(json_input: str | dict) -> str:
+def json_to_csv(json_input: str | bytes | dict) -> str:
     """
     Convert JSON to flattened CSV format.
 
     Args:
-        json_input: JSON string or dict. If the JSON has a 'results' key containing
-                   a list, it will be extracted. Otherwise, the entire structure
-                   will be wrapped in a list for processing.
+        json_input: JSON string, raw UTF-8 response bytes, or dict. If the JSON
+                   has a 'results' key containing a list, it will be extracted.
+                   Otherwise, the entire structure will be wrapped in a list
+                   for processing.
+
+    Returns:
+        CSV string with headers and flattened rows
+    """
+    records = _extract_records(json_input)
+    if isinstance(json_input, (str, bytes, bytearray)):
+        # We parsed this list ourselves, so flatten it in place: each nested
+        # record is freed as soon as its flat row replaces it, and market-wide
+        # payloads (10,000+ records) never hold both copies at once
+        for i, record in enumerate(records):
+            records[i] = _flatten_dict(record)
+        flattened_records = records
+    else:
+        flattened_records = [_flatten_dict(record) for record in records]
+    del records
+
+    if not flattened_records:
+        return ""
+
+    # Get all unique keys across all records (for consistent column ordering).
+    # dict.fromkeys dedupes in first-seen order without a Python-level loop.
+    all_keys = list(dict.fromkeys(chain.from_iterable(flattened_records)))
+
+    output = _get_csv_buffer()
+    try:
+        writer = csv.DictWriter(output, fieldnames=all_keys, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(flattened_records)
+
+        return output.getvalue()
+    finally:
+        # Drop the contents but keep the buffer for the next call
+        output.seek(0)
+        output.truncate()
+
+
+def json_to_csv_columnar(json_input: str | bytes | dict) -> str:
+    """
+    Convert large batches of uniform records to CSV using Arrow.
+
+    Intended for market-wide and fetch_all endpoints (grouped daily bars,
+    universal snapshots, 50,000-bar aggregates) where json_to_csv spends most
+    of its time flattening and formatting rows in Python. Records are
+    converted to an Arrow table, nested objects are flattened into
+    parent_child columns and the CSV is written in native code.
+
+    Small batches, and records Arrow cannot render identically (lists,
+    values needing CSV quoting, mixed types), go through json_to_csv, so the
+    columns and values are the same either way. Floats may be printed in
+    their shortest form (150 instead of 150.0).
+
+    Args:
+        json_input: JSON string, raw UTF-8 response bytes, or dict, with the
+                   same 'results' handling as json_to_csv
 
     Returns:
         CSV string with headers and flattened rows
     """
-    # Parse JSON if it's a string
-    if isinstance(json_input, str):
+    records = _extract_records(json_input)
+    # A list in the first record (e.g. trade condition codes) would force the
+    # generic path anyway, so skip building the Arrow table
+    if len(records) >= COLUMNAR_MIN_ROWS and not _contains_list(records[0]):
+        try:
+            csv_data = _records_to_csv_arrow(records)
+        except (pa.ArrowException, TypeError):
+            csv_data = None
+        if csv_data is not None:
+            return csv_data
+    return json_to_csv(records)
+
+
+def json_to_arrow_ipc(json_input: str | bytes | dict) -> str:
+    """
+    Convert records to a base64-encoded Arrow IPC stream.
+
+    For programmatic clients that load results into pandas, polars or DuckDB
+    rather than reading them: the typed columnar stream skips CSV formatting
+    and parsing entirely. Nested objects are flattened into parent_child
+    columns as in json_to_csv; lists are kept as Arrow list columns.
+
+    Args:
+        json_input: JSON string, raw UTF-8 response bytes, or dict, with the
+                   same 'results' handling as json_to_csv
+
+    Returns:
+        Base64 text of the Arrow IPC stream (decode, then read with
+        pyarrow.ipc.open_stream)
+    """
+    records = _extract_records(json_input)
+    if records:
+        table = pa.Table.from_struct_array(pa.array(records))
+        while any(pa.types.is_struct(field.type) for field in table.schema):
+            table = table.flatten()
+        table = table.rename_columns(
+            [name.replace(".", "_") for name in table.column_names]
+        )
+    else:
+        table = pa.table({})
+
+    sink = pa.BufferOutputStream()
+    with pa_ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return base64.b64encode(sink.getvalue()).decode("ascii")
+
+
+def _records_to_csv_arrow(records: List[Any]) -> Optional[str]:
+    """
+    Render records to CSV through an Arrow table.
+
+    Args:
+        records: List of (possibly nested) record dicts
+
+    Returns:
+        CSV string, or None if a column cannot be rendered like json_to_csv
+    """
+    table = pa.Table.from_struct_array(pa.array(records))
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+
+    columns = []
+    for column in table.columns:
+        if pa.types.is_boolean(column.type):
+            # Match Python's str(bool) rather than Arrow's true/false
+            column = pc.if_else(column, "True", "False")
+        elif not (
+            pa.types.is_integer(column.type)
+            or pa.types.is_floating(column.type)
+            or pa.types.is_string(column.type)
+            or pa.types.is_null(column.type)
+        ):
+            return None
+        columns.append(column)
+
+    names = [name.replace(".", "_") for name in table.column_names]
+    if any(char in name for name in names for char in ',"\r\n'):
+        return None
+    table = pa.table(columns, names=names)
+
+    # Write the header into the same buffer so the result is decoded once,
+    # without a second full-size copy from concatenating header and rows
+    output = io.BytesIO()
+    output.write((",".join(names) + "\n").encode("utf-8"))
+    # quoting_style="none" raises ArrowInvalid on values that need quoting,
+    # which sends the batch back through json_to_csv
+    pa_csv.write_csv(
+        table,
+        output,
+        pa_csv.WriteOptions(include_header=False, quoting_style="none"),
+    )
+    return output.getvalue().decode("utf-8")
+
+
+def _contains_list(value: Any) -> bool:
+    """Return True if a (nested) record holds any list value."""
+    if isinstance(value, list):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_list(v) for v in value.values())
+    return False
+
+
+def _extract_records(json_input: str | bytes | dict | list) -> List[Any]:
+    """
+    Parse JSON input and return the list of records to render as rows.
+
+    Args:
+        json_input: JSON string, raw UTF-8 response bytes, dict, or list
+
+    Returns:
+        The 'results' list (or indicator 'values'), the snapshot 'tickers'
+        list, the list itself, or the whole object wrapped in a list
+    """
+    # Parse JSON if it's a string or raw bytes (json.loads decodes UTF-8 itself)
+    if isinstance(json_input, (str, bytes, bytearray)):
         data = json.loads(json_input)
     else:
         data = json_input
@@ -65,6 +265,9 @@ def json_to_csv(json_input: str | dict) -> str:
         # Handle technical indicators format: {"results": {"underlying": {...}, "values": [...]}}
         if isinstance(records, dict) and "values" in records:
             records = records["values"]
+    elif isinstance(data, dict) and isinstance(data.get("tickers"), list):
+        # v2 snapshot endpoints (full market, gainers/losers) list rows under "tickers"
+        records = data["tickers"]
     elif isinstance(data, list):
         records = data
     else:
@@ -74,26 +277,7 @@ def json_to_csv(json_input: str | dict) -> str:
     if not isinstance(records, list):
         records = [records]
 
-    flattened_records = [_flatten_dict(record) for record in records]
-
-    if not flattened_records:
-        return ""
-
-    # Get all unique keys across all records (for consistent column ordering)
-    all_keys = []
-    seen = set()
-    for record in flattened_records:
-        for key in record.keys():
-            if key not in seen:
-                all_keys.append(key)
-                seen.add(key)
-
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=all_keys, lineterminator="\n")
-    writer.writeheader()
-    writer.writerows(flattened_records)
-
-    return output.getvalue()
+    return records
 
 
 def _flatten_dict(
@@ -116,7 +300,7 @@ def _flatten_dict(
 
     items = []
     for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        new_key = _join_key(parent_key, k, sep) if parent_key else k
 
         if isinstance(v, dict):
             # Recursively flatten nested dicts
@@ -130,6 +314,17 @@ def _flatten_dict(
     return dict(items)
 
 
+@lru_cache(maxsize=4096)
+def _join_key(parent_key: str, key: str, sep: str) -> str:
+    """
+    Build a flattened column name such as "lastQuote_bp".
+
+    Endpoint schemas are fixed, so the same handful of nested names repeats
+    on every row; caching avoids re-formatting them per record.
+    """
+    return f"{parent_key}{sep}{key}"
+
+
 def calculate_gex(
     options_data: List[Dict[str, Any]], stock_price: float
 ) -> Dict[str, Any]:
@@ -7,9 +7,10 @@ when fetching paginated data from Polygon.io API.
 
 import asyncio
 from typing import List, Dict, Any, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor
 import json
 
+from .utils import call_polygon
+
 
 class ParallelFetcher:
     """Fetches paginated API data in parallel using multiple workers."""
@@ -102,15 +103,8 @@ class ParallelFetcher:
         Returns:
             Tuple of (data_items, next_cursor)
         """
-        # Run in thread pool to avoid blocking async loop
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            result = await loop.run_in_executor(
-                executor,
-                lambda: fetch_func(cursor=cursor),
-            )
-
-        return result
+        # Run in a worker thread to avoid blocking async loop
+        return await asyncio.to_thread(fetch_func, cursor=cursor)
 
     async def _fetch_parallel_pages(
         self,
@@ -238,6 +232,19 @@ class PolygonParallelFetcher(ParallelFetcher):
         super().__init__(num_workers)
         self.client = polygon_client
 
+    async def _fetch_page(
+        self,
+        fetch_func: Callable,
+        cursor: Optional[str],
+    ) -> tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch a single page on the shared Polygon pool.
+
+        Pages count against the same POLYGON_MAX_INFLIGHT budget as every
+        other SDK call, so concurrent fetch_all tools share one limit.
+        """
+        return await call_polygon(fetch_func, cursor=cursor)
+
     def create_fetch_function(
         self,
         method_name: str,
@@ -275,9 +282,8 @@ class PolygonParallelFetcher(ParallelFetcher):
             params["raw"] = True
             response = method(**params)
 
-            # Parse response
-            data_bytes = response.data
-            data_json = json.loads(data_bytes.decode("utf-8"))
+            # Parse the raw bytes directly (json.loads decodes UTF-8 itself)
+            data_json = json.loads(response.data)
 
             # Extract results and next cursor
             results = data_json.get("results", [])
@@ -0,0 +1,544 @@
+"""
+In-process TTL cache for tool responses.
+
+Tools called repeatedly with identical arguments (LLM sessions re-asking for
+the same snapshot or the same historical day) can return the previously
+rendered CSV instead of making another Polygon round trip and re-running the
+JSON-to-CSV conversion. Immutable historical results can additionally be
+persisted to a small SQLite file so they survive server restarts, and
+expired entries can be revalidated upstream with a conditional request.
+"""
+
+import asyncio
+import inspect
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import wraps
+from pathlib import Path
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Union
+
+from polygon.exceptions import BadResponse
+from polygon.rest.models.request import RequestOptionBuilder
+
+from .utils import call_polygon, clear_response_status, last_response_status
+
+# TTL (seconds) for data that can no longer change, e.g. a past trading day
+HISTORICAL_TTL = 86400
+
+# How long persisted historical results are kept on disk (30 days)
+PERSISTENT_TTL = 30 * 86400
+
+# SQLite file backing the persistent tier (next to the Parquet cache)
+RESPONSE_CACHE_PATH = os.getenv(
+    "POLYGON_RESPONSE_CACHE_PATH", "./cache/_responses.sqlite3"
+)
+
+_MISSING = object()
+
+TTLSpec = Union[float, Callable[[Dict[str, Any]], float]]
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire after a time-to-live.
+
+    Entries are evicted least-recently-used first once maxsize is reached.
+    Expired entries are dropped lazily on access.
+
+    Example:
+        >>> cache = TTLCache(maxsize=2, ttl=15)
+        >>> cache.set("key", "value")
+        >>> cache.get("key")
+        'value'
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (default: cache TTL)."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._data[key] = (monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove key if present."""
+        self._data.pop(key, None)
+
+    def keys(self) -> List[Hashable]:
+        """Return a snapshot of the stored keys (including expired ones)."""
+        return list(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    Persistent string cache backed by a single SQLite table.
+
+    Used for results that can no longer change (a past trading day), so a
+    restarted server does not re-fetch them. The database is opened lazily on
+    first use and entries expire after PERSISTENT_TTL seconds.
+
+    Example:
+        >>> cache = DiskCache("./cache/_responses.sqlite3")
+        >>> cache.set("key", "csv")
+        >>> cache.get("key")
+        'csv'
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: float = PERSISTENT_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (and create if needed) the backing database."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, expires_at REAL NOT NULL, tags TEXT NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value for key, or None if missing/expired."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, tags: Iterable[str] = ()) -> None:
+        """Store value under key for the cache TTL, labelled with tags."""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, value, time.time() + self.ttl, _pack_tags(tags)),
+            )
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """Remove entries labelled with any of tags (any case); return how many."""
+        conn = self._connect()
+        removed = 0
+        with conn:
+            for tag in tags:
+                removed += conn.execute(
+                    "DELETE FROM responses WHERE instr(lower(tags), ?) > 0",
+                    (_pack_tags([tag.lower()]),),
+                ).rowcount
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM responses")
+
+
+_disk_cache = DiskCache(RESPONSE_CACHE_PATH)
+
+# In-memory caches created by ttl_cached, by tool name, for invalidate_tags
+_tool_caches: Dict[str, "TTLCache"] = {}
+
+# Tool arguments that identify what a cached result is about, and the tag
+# prefix each contributes (e.g. ticker="AAPL" -> "ticker:AAPL")
+_TAG_ARGUMENTS = {
+    "ticker": "ticker",
+    "tickers": "ticker",
+    "ticker_any_of": "ticker",
+    "underlying_asset": "ticker",
+    "option_contract": "ticker",
+    "market_type": "market",
+    "date": "date",
+}
+
+# Strong references to stale-while-revalidate refreshes so they are not
+# garbage collected before they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _pack_tags(tags: Iterable[str]) -> str:
+    """Serialize tags as "|a|b|" so one can be matched with instr()."""
+    return "|" + "".join(f"{tag}|" for tag in tags)
+
+
+def cache_tags(tool_name: str, key: Hashable) -> Set[str]:
+    """
+    Derive invalidation tags for a cached call from its frozen arguments.
+
+    Args:
+        tool_name: Name of the cached tool
+        key: Frozen bound arguments, as built by ttl_cached
+
+    Returns:
+        Lowercased tags such as {"tool:get_snapshot_all", "market:stocks",
+        "ticker:aapl"}, so matching is case-insensitive
+
+    Example:
+        >>> sorted(cache_tags("get_snapshot_all", (("market_type", "stocks"),)))
+        ['market:stocks', 'tool:get_snapshot_all']
+    """
+    tags = {f"tool:{tool_name}"}
+    for name, value in key:
+        prefix = _TAG_ARGUMENTS.get(name)
+        if prefix is None or value is None:
+            continue
+        for item in value if isinstance(value, tuple) else (value,):
+            tags.add(f"{prefix}:{item}".lower())
+    return tags
+
+
+def invalidate_tags(*tags: str) -> int:
+    """
+    Evict every cached tool result, in memory and on disk, carrying a tag.
+
+    Tags are derived from tool arguments by cache_tags: "tool:<name>",
+    "ticker:<symbol>", "market:<market_type>" and "date:<YYYY-MM-DD>";
+    they are matched case-insensitively, so "ticker:aapl" evicts AAPL.
+
+    Args:
+        *tags: Tags to invalidate (a result matching any of them is evicted)
+
+    Returns:
+        Number of entries removed
+
+    Example:
+        >>> invalidate_tags("ticker:AAPL")  # e.g. after a split
+        3
+    """
+    wanted = {tag.lower() for tag in tags}
+    removed = 0
+    for tool_name, cache in _tool_caches.items():
+        for key in cache.keys():
+            if wanted & cache_tags(tool_name, key):
+                cache.pop(key)
+                removed += 1
+    # Drop matching revalidation state too, so the next call is a plain fetch
+    # rather than a conditional one that could re-serve the evicted render
+    for key in _validators.keys():
+        method, _, arguments = key
+        if wanted & cache_tags(getattr(method, "__name__", ""), arguments):
+            _validators.pop(key)
+    return removed + _disk_cache.invalidate(wanted)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert tool arguments (lists, dicts) into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def ttl_cached(
+    ttl: TTLSpec, maxsize: int = 256, persist: bool = False, stale: float = 0
+):
+    """
+    Cache an async tool's string result per argument set.
+
+    Concurrent calls with the same arguments share one upstream request: the
+    first caller fetches while the others wait on a per-key lock and then
+    read the cached value. Results starting with "Error:" are never cached.
+
+    With stale > 0 the cache serves stale-while-revalidate: for stale
+    seconds after a result stops being fresh it is still returned
+    immediately, while a single background task fetches a replacement.
+
+    Args:
+        ttl: Seconds to keep a result, or a callable receiving the bound
+            arguments (with defaults applied) and returning seconds
+        maxsize: Maximum number of cached argument sets
+        persist: Also store results whose TTL is at least HISTORICAL_TTL in
+            the on-disk cache and consult it on in-memory misses. Only use
+            for tools returning plain CSV (not Parquet cache metadata).
+        stale: Seconds past the TTL during which a cached result is served
+            while it is refreshed in the background
+
+    Usage:
+        @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+        @ttl_cached(ttl=15)
+        async def get_snapshot_all(...):
+            ...
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        # Entries are (fresh_until, value) and expire stale seconds later
+        cache = TTLCache(maxsize=maxsize, ttl=0)
+        locks: Dict[Hashable, asyncio.Lock] = {}
+
+        def store(key: Hashable, value: str, seconds: float) -> None:
+            if seconds > 0:
+                cache.set(key, (monotonic() + seconds, value), seconds + stale)
+
+        async def load(key: Hashable, arguments: Dict[str, Any], args, kwargs):
+            """Fetch under the key's lock unless another caller just did."""
+            lock = locks.setdefault(key, asyncio.Lock())
+            try:
+                async with lock:
+                    entry = cache.get(key)
+                    if entry is not None and entry[0] > monotonic():
+                        return entry[1]
+
+                    seconds = ttl(arguments) if callable(ttl) else ttl
+                    disk_key = None
+                    if persist and seconds >= HISTORICAL_TTL:
+                        disk_key = f"{func.__qualname__}:{key!r}"
+                        stored = _disk_cache.get(disk_key)
+                        if stored is not None:
+                            store(key, stored, seconds)
+                            return stored
+
+                    result = await func(*args, **kwargs)
+                    if isinstance(result, str) and not result.startswith("Error:"):
+                        store(key, result, seconds)
+                        if disk_key is not None:
+                            _disk_cache.set(
+                                disk_key, result, cache_tags(func.__name__, key)
+                            )
+                    return result
+            finally:
+                if not lock.locked() and locks.get(key) is lock:
+                    del locks[key]
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _freeze(bound.arguments)
+
+            entry = cache.get(key)
+            if entry is not None:
+                fresh_until, value = entry
+                if fresh_until > monotonic():
+                    return value
+                if stale:
+                    # Serve the stale value; refresh once unless already running
+                    if key not in locks:
+                        locks[key] = asyncio.Lock()
+                        task = asyncio.ensure_future(
+                            load(key, bound.arguments, args, kwargs)
+                        )
+                        _background_tasks.add(task)
+                        task.add_done_callback(_background_tasks.discard)
+                    return value
+
+            return await load(key, bound.arguments, args, kwargs)
+
+        wrapper.cache = cache
+        _tool_caches[func.__name__] = cache
+        return wrapper
+
+    return decorator
+
+
+def singleflight(func):
+    """
+    Collapse concurrent identical calls of an async tool into one.
+
+    The first call for an argument set starts the tool body as a task; calls
+    with equal arguments that arrive while it is running await the same task
+    instead of issuing their own upstream request. Nothing is kept once the
+    task finishes, so this is for tools whose results must stay fresh (use
+    ttl_cached, which also collapses concurrent misses, for the rest).
+
+    Cancelling one caller does not cancel the shared task for the others.
+
+    Usage:
+        @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+        @singleflight
+        async def get_snapshot_ticker(...):
+            ...
+    """
+    signature = inspect.signature(func)
+    inflight: Dict[Hashable, asyncio.Task] = {}
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = _freeze(bound.arguments)
+
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            inflight[key] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if inflight.get(key) is done:
+                    del inflight[key]
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    wrapper.inflight = inflight
+    return wrapper
+
+
+def date_ttl(argument: str, recent: float, historical: float = HISTORICAL_TTL):
+    """
+    Build a TTL callable that keeps results for past dates much longer.
+
+    Args:
+        argument: Name of the tool argument holding a YYYY-MM-DD date
+        recent: TTL for today/future or unparseable dates
+        historical: TTL for dates strictly before today
+
+    Example:
+        >>> @ttl_cached(ttl=date_ttl("date", recent=300))
+    """
+
+    def compute(arguments: Dict[str, Any]) -> float:
+        value = arguments.get(argument)
+        if isinstance(value, datetime):
+            value = value.date()
+        try:
+            day = value if isinstance(value, date) else date.fromisoformat(value)
+        except (TypeError, ValueError):
+            return recent
+        return historical if day < date.today() else recent
+
+    return compute
+
+
+def timespan_ttl(
+    argument: str, ttls: Dict[str, float], default: float
+) -> Callable[[Dict[str, Any]], float]:
+    """
+    Build a TTL callable keyed on a bar-size argument such as timespan.
+
+    Results computed from short bars change as soon as the current bar
+    moves, while daily and longer series are stable for minutes.
+
+    Args:
+        argument: Name of the tool argument holding the bar size
+        ttls: TTL per bar size (e.g. {"minute": 30, "hour": 300})
+        default: TTL for bar sizes not listed
+
+    Example:
+        >>> @ttl_cached(ttl=timespan_ttl("timespan", {"minute": 30}, 900))
+    """
+
+    def compute(arguments: Dict[str, Any]) -> float:
+        return ttls.get(arguments.get(argument), default)
+
+    return compute
+
+
+# Conditional-request headers and rendered result of the last response per
+# request, kept well past the tool TTLs so an expired entry can still be
+# revalidated upstream
+_validators = TTLCache(maxsize=256, ttl=3600)
+
+# Rendered results larger than this (in characters) are not kept for
+# revalidation; re-serving them would pin many MB per entry for an hour
+_MAX_REVALIDATED_SIZE = 1 << 20
+
+
+def _revalidation_headers(headers: Any) -> Optional[Dict[str, str]]:
+    """Build the conditional-request headers a response's validators allow."""
+    etag = headers.get("ETag")
+    if isinstance(etag, str):
+        return {"If-None-Match": etag}
+    last_modified = headers.get("Last-Modified")
+    if isinstance(last_modified, str):
+        return {"If-Modified-Since": last_modified}
+    return None
+
+
+def _fetch_unless_not_modified(
+    method: Callable, options: Optional[RequestOptionBuilder], kwargs: Dict
+) -> Any:
+    """Call method for its raw response, or return None on a 304."""
+    clear_response_status()
+    try:
+        return method(raw=True, options=options, **kwargs)
+    except BadResponse:
+        if options is not None and last_response_status() == 304:
+            return None
+        raise
+
+
+async def conditional_fetch(
+    method: Callable, render: Callable[[bytes], Any], **kwargs
+) -> Any:
+    """
+    Fetch a Polygon endpoint, revalidating the last response upstream.
+
+    If the previous response to the same request carried an ETag it is sent
+    back as If-None-Match (or, lacking one, its Last-Modified date as
+    If-Modified-Since). A 304 Not Modified (told apart from other errors by
+    the status record_response_status keeps, since the SDK raises every
+    non-200 as a BadResponse) re-serves the result rendered last time,
+    skipping the transfer, parse and CSV rebuild. Endpoints that send
+    neither validator, and results over _MAX_REVALIDATED_SIZE, behave
+    exactly like call_polygon(method, raw=True) followed by render.
+
+    Args:
+        method: Bound polygon_client method supporting raw and options
+        render: Converts the raw response bytes into the tool's result
+        **kwargs: Arguments forwarded to method
+
+    Returns:
+        The rendered result
+
+    Example:
+        >>> csv_data = await conditional_fetch(
+        ...     polygon_client.get_previous_close_agg, json_to_csv, ticker="AAPL"
+        ... )
+    """
+    key = (method, render, _freeze(kwargs))
+    previous = _validators.get(key)
+    options = None
+    if previous is not None:
+        options = RequestOptionBuilder()
+        options.headers = previous[0]
+
+    # Runs on the worker thread so the recorded status is this call's own
+    response = await call_polygon(_fetch_unless_not_modified, method, options, kwargs)
+    if response is None:
+        _validators.set(key, previous)
+        return previous[1]
+
+    rendered = render(response.data)
+    headers = _revalidation_headers(response.headers)
+    if headers is not None and len(rendered) <= _MAX_REVALIDATED_SIZE:
+        _validators.set(key, (headers, rendered))
+    return rendered
@@ -7,15 +7,16 @@ Provides functions for:
 - Classifying short scenarios for trading setups
 """
 
+import asyncio
 import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 
-from ...clients import polygon_client
+from ...clients import http_session, polygon_client
+from ...utils import call_polygon
 
 
 async def fetch_earnings_calendar(
@@ -32,7 +33,6 @@ async def fetch_earnings_calendar(
     **Returns:**
     List of earnings events with keys: symbol, name, reportDate, estimate
     """
-    import requests
     import io
     import csv
 
@@ -51,7 +51,7 @@ async def fetch_earnings_calendar(
         "apikey": api_key,
     }
 
-    response = requests.get(url, params=params, timeout=30)
+    response = await asyncio.to_thread(http_session.get, url, params=params, timeout=30)
     response.raise_for_status()
 
     # Parse CSV response
@@ -167,7 +167,8 @@ async def _fetch_single_ticker_short_volume(
     import json
 
     try:
-        response = polygon_client._get(
+        response = await call_polygon(
+            polygon_client._get,
             "/stocks/fundamentals/short-volume",
             params=params,
         )
@@ -244,6 +245,9 @@ def analyze_short_pattern(
     # Calculate 10-day average
     current_avg = last_10["short_volume_ratio"].mean()
 
+    # Deferred: scipy.stats takes ~0.5 s to import and is only needed here
+    from scipy import stats
+
     # Calculate trend slope using linear regression
     x = np.arange(len(last_10))
     y = last_10["short_volume_ratio"].values
@@ -11,6 +11,7 @@ import pandas as pd
 import json
 
 from ...clients import polygon_client
+from ...utils import call_polygon
 
 
 async def validate_fundamentals(
@@ -62,7 +63,8 @@ async def validate_fundamentals(
             ratio_params["debt_to_equity_lte"] = max_debt_to_equity
 
         # Fetch ratios using direct REST API call
-        response = polygon_client._get(
+        response = await call_polygon(
+            polygon_client._get,
             "/stocks/financials/v1/ratios",
             params=ratio_params,
         )
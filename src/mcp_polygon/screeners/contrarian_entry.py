@@ -17,6 +17,7 @@ from mcp.types import ToolAnnotations
 from ..clients import poly_mcp, polygon_client
 from ..parallel_fetcher import PolygonParallelFetcher
 from ..tool_integration import process_tool_response
+from ..utils import call_polygon
 
 from .common import validate_fundamentals, format_screener_results
 
@@ -607,23 +608,26 @@ async def _batch_fetch_prices(tickers: List[str]) -> Dict[str, float]:
         end_date = datetime.now().strftime("%Y-%m-%d")
         start_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
 
-        prices = {}
-        for ticker in tickers:
-            try:
-                price_data = list(
-                    polygon_client.get_aggs(
-                        ticker=ticker,
-                        multiplier=1,
-                        timespan="day",
-                        from_=start_date,
-                        to=end_date,
-                        limit=2,
-                    )
+        responses = await asyncio.gather(
+            *(
+                call_polygon(
+                    polygon_client.get_aggs,
+                    ticker=ticker,
+                    multiplier=1,
+                    timespan="day",
+                    from_=start_date,
+                    to=end_date,
+                    limit=2,
                 )
-                if price_data:
-                    prices[ticker] = price_data[-1].close
-            except Exception:
-                pass
+                for ticker in tickers
+            ),
+            return_exceptions=True,
+        )
+
+        prices = {}
+        for ticker, price_data in zip(tickers, responses):
+            if not isinstance(price_data, Exception) and price_data:
+                prices[ticker] = list(price_data)[-1].close
 
         return prices
     except Exception as e:
@@ -634,19 +638,24 @@ async def _batch_fetch_prices(tickers: List[str]) -> Dict[str, float]:
 async def _batch_fetch_rsi(tickers: List[str]) -> Dict[str, float]:
     """Batch fetch RSI for all tickers."""
     try:
-        rsi_values = {}
-        for ticker in tickers:
-            try:
-                rsi_response = polygon_client.get_rsi(
+        responses = await asyncio.gather(
+            *(
+                call_polygon(
+                    polygon_client.get_rsi,
                     ticker=ticker,
                     timespan="day",
                     window=14,
                     limit=1,
                 )
-                if hasattr(rsi_response, "values") and rsi_response.values:
-                    rsi_values[ticker] = rsi_response.values[0].value
-            except Exception:
-                pass
+                for ticker in tickers
+            ),
+            return_exceptions=True,
+        )
+
+        rsi_values = {}
+        for ticker, rsi_response in zip(tickers, responses):
+            if getattr(rsi_response, "values", None):
+                rsi_values[ticker] = rsi_response.values[0].value
 
         return rsi_values
     except Exception as e:
@@ -657,19 +666,24 @@ async def _batch_fetch_rsi(tickers: List[str]) -> Dict[str, float]:
 async def _batch_fetch_sma(tickers: List[str], window: int) -> Dict[str, float]:
     """Batch fetch SMA for all tickers."""
     try:
-        sma_values = {}
-        for ticker in tickers:
-            try:
-                sma_response = polygon_client.get_sma(
+        responses = await asyncio.gather(
+            *(
+                call_polygon(
+                    polygon_client.get_sma,
                     ticker=ticker,
                     timespan="day",
                     window=window,
                     limit=1,
                 )
-                if hasattr(sma_response, "values") and sma_response.values:
-                    sma_values[ticker] = sma_response.values[0].value
-            except Exception:
-                pass
+                for ticker in tickers
+            ),
+            return_exceptions=True,
+        )
+
+        sma_values = {}
+        for ticker, sma_response in zip(tickers, responses):
+            if getattr(sma_response, "values", None):
+                sma_values[ticker] = sma_response.values[0].value
 
         return sma_values
     except Exception as e:
@@ -683,23 +697,26 @@ async def _batch_fetch_52w_low(tickers: List[str]) -> Dict[str, float]:
         end_date = datetime.now().strftime("%Y-%m-%d")
         year_ago = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
 
-        lows = {}
-        for ticker in tickers:
-            try:
-                year_data = list(
-                    polygon_client.get_aggs(
-                        ticker=ticker,
-                        multiplier=1,
-                        timespan="day",
-                        from_=year_ago,
-                        to=end_date,
-                        limit=252,
-                    )
+        responses = await asyncio.gather(
+            *(
+                call_polygon(
+                    polygon_client.get_aggs,
+                    ticker=ticker,
+                    multiplier=1,
+                    timespan="day",
+                    from_=year_ago,
+                    to=end_date,
+                    limit=252,
                 )
-                if year_data:
-                    lows[ticker] = min([d.low for d in year_data])
-            except Exception:
-                pass
+                for ticker in tickers
+            ),
+            return_exceptions=True,
+        )
+
+        lows = {}
+        for ticker, year_data in zip(tickers, responses):
+            if not isinstance(year_data, Exception) and year_data:
+                lows[ticker] = min([d.low for d in year_data])
 
         return lows
     except Exception as e:
@@ -5,6 +5,7 @@ This module provides a Model Context Protocol server for Polygon.io financial ma
 All tools are defined in the tools/ sub-package and automatically registered when imported.
 """
 
+import asyncio
 from typing import Literal
 from .clients import poly_mcp
 
@@ -12,6 +13,17 @@ from .clients import poly_mcp
 from . import tools  # noqa: F401
 
 
+def _install_uvloop() -> bool:
+    """Use uvloop's event loop for the server if it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def run(transport: Literal["stdio", "sse", "streamable-http"] = "stdio") -> None:
     """Run the Polygon MCP server."""
+    _install_uvloop()
     poly_mcp.run(transport)
@@ -4,19 +4,27 @@ Integration helper for adding caching to Polygon MCP tools.
 Provides a simple wrapper to enable caching with minimal code changes.
 """
 
-from typing import Dict, Any, Callable
+import asyncio
 import csv
-import io
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import pyarrow as pa
 
 from .cache_manager import get_cache_manager
-from .response_formatter import ResponseFormatter
 from .formatters import json_to_csv
+from .response_formatter import ResponseFormatter
+
+# Serializes batch writes from worker threads: save_batch numbers files by
+# globbing the partition, and concurrent fetches can share a partition
+_batch_write_lock = threading.Lock()
 
 
 async def process_tool_response(
     tool_name: str,
     params: Dict[str, Any],
     csv_data: str,
+    schema: Optional[Dict[str, pa.DataType]] = None,
 ) -> str:
     """
     Process tool response with intelligent caching decision.
@@ -31,6 +39,7 @@ async def process_tool_response(
         tool_name: Name of the MCP tool (e.g., 'get_aggs')
         params: Parameters used in the API call
         csv_data: CSV response from json_to_csv()
+        schema: Optional Parquet types for known columns (e.g. {"value": pa.float64()})
 
     Returns:
         Either:
@@ -40,8 +49,10 @@ async def process_tool_response(
     # Get cache manager
     cache_mgr = get_cache_manager()
 
-    # Calculate response size
-    response_size_bytes = len(csv_data.encode("utf-8"))
+    # Calculate response size (without encoding a copy of ASCII-only CSV)
+    response_size_bytes = (
+        len(csv_data) if csv_data.isascii() else len(csv_data.encode("utf-8"))
+    )
 
     # Check if we should cache
     if not cache_mgr.should_cache(tool_name, params, response_size_bytes):
@@ -73,6 +84,7 @@ async def process_tool_response(
             params=params,
             csv_data=csv_data,
             columns=columns,
+            schema=schema,
         )
 
         # Parse CSV for sample rows
@@ -93,22 +105,40 @@ async def process_tool_response(
         return ResponseFormatter.format_direct(csv_data)
 
 
+def _iter_lines(text: str) -> Iterator[str]:
+    """
+    Lazily yield the lines of a string, keeping line endings.
+
+    Unlike io.StringIO (which holds a 4-byte-per-character copy) or
+    splitlines(), only the lines actually consumed are copied, so reading a
+    CSV header or a few sample rows from a full-market response stays cheap.
+    """
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start : end + 1]
+        start = end + 1
+
+
 def _extract_columns(csv_data: str) -> list:
     """Extract column names from CSV string."""
-    if not csv_data.strip():
+    if not csv_data or csv_data.isspace():
         return []
 
-    reader = csv.DictReader(io.StringIO(csv_data))
+    reader = csv.DictReader(_iter_lines(csv_data))
     return list(reader.fieldnames) if reader.fieldnames else []
 
 
 def _parse_csv_sample(csv_data: str, n: int = 3) -> list:
     """Parse first N rows from CSV string."""
-    if not csv_data.strip():
+    if not csv_data or csv_data.isspace():
         return []
 
     try:
-        reader = csv.DictReader(io.StringIO(csv_data))
+        reader = csv.DictReader(_iter_lines(csv_data))
         rows = []
         for i, row in enumerate(reader):
             if i >= n:
@@ -122,10 +152,14 @@ def _parse_csv_sample(csv_data: str, n: int = 3) -> list:
 def create_batch_writer(
     tool_name: str,
     params: Dict[str, Any],
+    schema: Optional[Dict[str, pa.DataType]] = None,
 ) -> tuple[Callable, Callable]:
     """
     Create batch writing callbacks for streaming cache writes.
 
+    If schema is given, those columns are stored with the given Parquet
+    types instead of as strings.
+
     Returns a tuple of (batch_callback, finalize_callback):
     - batch_callback(batch_num, data): Writes a batch to disk
     - finalize_callback(): Finalizes the cache and returns response
@@ -158,11 +192,8 @@ def create_batch_writer(
         "sample_rows": [],
     }
 
-    async def batch_callback(batch_num: int, data: list):
-        """Write a batch to disk immediately."""
-        if not data:
-            return
-
+    def write_batch(batch_num: int, data: list):
+        """Convert a batch to CSV and write it to the Parquet cache."""
         # Convert batch to CSV
         csv_data = json_to_csv({"results": data})
 
@@ -176,17 +207,28 @@ def create_batch_writer(
             state["sample_rows"].extend(batch_sample)
 
         # Write batch to disk
-        cache_mgr.save_batch(
-            tool_name=tool_name,
-            params=params,
-            csv_data=csv_data,
-            batch_num=batch_num,
-            columns=state["columns"],
-        )
+        with _batch_write_lock:
+            cache_mgr.save_batch(
+                tool_name=tool_name,
+                params=params,
+                csv_data=csv_data,
+                batch_num=batch_num,
+                columns=state["columns"],
+                schema=schema,
+            )
 
         # Update row count
         state["total_rows"] += len(data)
 
+    async def batch_callback(batch_num: int, data: list):
+        """Write a batch to disk immediately."""
+        if not data:
+            return
+
+        # CSV conversion and Parquet encoding are CPU-bound; run them off the
+        # event loop so other tool calls keep being served during the write
+        await asyncio.to_thread(write_batch, batch_num, data)
+
     async def finalize():
         """Finalize batch writing and return response."""
         if state["total_rows"] == 0:
@@ -204,8 +246,8 @@ def create_batch_writer(
         # Build sample CSV for response
         sample_csv = ""
         if state["sample_rows"]:
-            import io
             import csv as csv_module
+            import io
 
             output = io.StringIO()
             if state["columns"]:
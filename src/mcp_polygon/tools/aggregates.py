@@ -4,13 +4,15 @@ from typing import Optional, Any, Dict, Union
 from mcp.types import ToolAnnotations
 from datetime import datetime, date
 from ..clients import poly_mcp, polygon_client
-from ..formatters import json_to_csv
+from ..formatters import json_to_csv, json_to_csv_columnar
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..response_cache import conditional_fetch, ttl_cached, date_ttl
+from ..utils import build_params, normalize_date, call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=date_ttl("to", recent=60), maxsize=512)
 async def get_aggs(
     ticker: str,
     multiplier: int,
@@ -59,6 +61,11 @@ async def get_aggs(
             fetch_all=fetch_all,
         )
 
+        # Canonicalize dates once so every fetch path forwards the same values
+        # (tool_params keeps the caller's strings for cache partition keys)
+        from_ = normalize_date(from_)
+        to = normalize_date(to)
+
         if fetch_all:
             # Use batch writing for memory efficiency
             batch_callback, finalize = create_batch_writer("get_aggs", tool_params)
@@ -96,11 +103,12 @@ async def get_aggs(
                     limit=limit,
                     params=params,
                 )
-                csv_data = json_to_csv({"results": aggs_list})
+                csv_data = json_to_csv_columnar({"results": aggs_list})
                 return await process_tool_response("get_aggs", tool_params, csv_data)
         else:
             # Single page approach
-            results = polygon_client.get_aggs(
+            results = await call_polygon(
+                polygon_client.get_aggs,
                 ticker=ticker,
                 multiplier=multiplier,
                 timespan=timespan,
@@ -122,7 +130,7 @@ async def get_aggs(
             data = {"results": aggs_list, "status": "OK"}
 
             # Convert to CSV
-            csv_data = json_to_csv(data)
+            csv_data = json_to_csv_columnar(data)
 
             # Process with intelligent caching
             return await process_tool_response("get_aggs", tool_params, csv_data)
@@ -131,6 +139,7 @@ async def get_aggs(
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=date_ttl("date", recent=300), maxsize=512)
 async def get_grouped_daily_aggs(
     date: str,
     adjusted: Optional[bool] = None,
@@ -159,7 +168,8 @@ async def get_grouped_daily_aggs(
     Note: Large dataset. Useful for market screening, heatmaps, and identifying top gainers/losers.
     """
     try:
-        results = polygon_client.get_grouped_daily_aggs(
+        results = await call_polygon(
+            polygon_client.get_grouped_daily_aggs,
             date=date,
             adjusted=adjusted,
             include_otc=include_otc,
@@ -169,8 +179,8 @@ async def get_grouped_daily_aggs(
             raw=True,
         )
 
-        # Convert to CSV
-        csv_data = json_to_csv(results.data.decode("utf-8"))
+        # Convert to CSV straight from the raw bytes (no decoded str copy)
+        csv_data = json_to_csv_columnar(results.data)
 
         # Process with intelligent caching
         return await process_tool_response(
@@ -187,6 +197,7 @@ async def get_grouped_daily_aggs(
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=date_ttl("date", recent=60), maxsize=4096, persist=True)
 async def get_daily_open_close_agg(
     ticker: str,
     date: str,
@@ -210,16 +221,22 @@ async def get_daily_open_close_agg(
     Note: For multiple days, use get_aggs. For most recent day, use get_previous_close_agg.
     """
     try:
-        results = polygon_client.get_daily_open_close_agg(
-            ticker=ticker, date=date, adjusted=adjusted, params=params, raw=True
+        results = await call_polygon(
+            polygon_client.get_daily_open_close_agg,
+            ticker=ticker,
+            date=date,
+            adjusted=adjusted,
+            params=params,
+            raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=300, maxsize=4096)
 async def get_previous_close_agg(
     ticker: str,
     adjusted: Optional[bool] = None,
@@ -241,10 +258,12 @@ async def get_previous_close_agg(
     Note: For specific dates, use get_daily_open_close_agg. For multiple days, use get_aggs.
     """
     try:
-        results = polygon_client.get_previous_close_agg(
-            ticker=ticker, adjusted=adjusted, params=params, raw=True
+        return await conditional_fetch(
+            polygon_client.get_previous_close_agg,
+            json_to_csv,
+            ticker=ticker,
+            adjusted=adjusted,
+            params=params,
         )
-
-        return json_to_csv(results.data.decode("utf-8"))
     except Exception as e:
         return f"Error: {e}"
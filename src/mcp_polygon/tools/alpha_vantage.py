@@ -1,10 +1,10 @@
 """Alpha Vantage API tools."""
 
+import asyncio
 from typing import Optional
 from mcp.types import ToolAnnotations
-from ..clients import poly_mcp
+from ..clients import poly_mcp, http_session
 from ..tool_integration import process_tool_response
-import requests
 import os
 
 
@@ -54,8 +54,8 @@ async def get_earnings_calendar_alpha_vantage(
         if symbol:
             params["symbol"] = symbol
 
-        # Make request
-        response = requests.get(url, params=params)
+        # Make request (in a worker thread so the event loop keeps serving)
+        response = await asyncio.to_thread(http_session.get, url, params=params)
 
         # Check for API errors
         if response.status_code != 200:
@@ -7,7 +7,7 @@ from ..clients import poly_mcp, polygon_client
 from ..formatters import json_to_csv
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..utils import build_params, call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -111,7 +111,8 @@ async def list_splits(
                 return await process_tool_response("list_splits", tool_params, csv_data)
         else:
             # Single page approach
-            results = polygon_client.list_splits(
+            results = await call_polygon(
+                polygon_client.list_splits,
                 ticker=ticker,
                 execution_date=execution_date,
                 reverse_split=reverse_split,
@@ -293,7 +294,8 @@ async def list_dividends(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_dividends(
+            results = await call_polygon(
+                polygon_client.list_dividends,
                 ticker=ticker,
                 ex_dividend_date=ex_dividend_date,
                 record_date=record_date,
@@ -348,7 +350,8 @@ async def get_ticker_events(
     Returns: ticker, event_type, event_date, plus type-specific fields (cash_amount, split_to/from, fiscal_period).
     """
     try:
-        results = polygon_client.get_ticker_events(
+        results = await call_polygon(
+            polygon_client.get_ticker_events,
             ticker=ticker,
             types=types,
             params=params,
@@ -363,7 +366,7 @@ async def get_ticker_events(
             # Wrap the events in a results key for consistent CSV formatting
             formatted_data = {"results": data["results"]["events"]}
             return json_to_csv(formatted_data)
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -463,7 +466,8 @@ async def list_ipos(
                 return await process_tool_response("list_ipos", tool_params, csv_data)
         else:
             # Single page approach
-            results = polygon_client.vx.list_ipos(
+            results = await call_polygon(
+                polygon_client.vx.list_ipos,
                 ticker=ticker,
                 us_code=us_code,
                 isin=isin,
@@ -4,6 +4,7 @@ from typing import Optional, Any, Dict
 from mcp.types import ToolAnnotations
 from ..clients import poly_mcp, polygon_client
 from ..formatters import json_to_csv
+from ..utils import call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -28,7 +29,8 @@ async def get_real_time_currency_conversion(
     Returns: Converted amount and exchange rate.
     """
     try:
-        results = polygon_client.get_real_time_currency_conversion(
+        results = await call_polygon(
+            polygon_client.get_real_time_currency_conversion,
             from_=from_,
             to=to,
             amount=amount,
@@ -37,6 +39,6 @@ async def get_real_time_currency_conversion(
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
@@ -7,7 +7,7 @@ from ..clients import poly_mcp, polygon_client
 from ..formatters import json_to_csv
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..utils import build_params, call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -93,7 +93,8 @@ async def list_treasury_yields(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_treasury_yields(
+            results = await call_polygon(
+                polygon_client.list_treasury_yields,
                 date=date,
                 date_lt=date_lt,
                 date_lte=date_lte,
@@ -207,7 +208,8 @@ async def list_inflation(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_inflation(
+            results = await call_polygon(
+                polygon_client.list_inflation,
                 date=date,
                 date_any_of=date_any_of,
                 date_gt=date_gt,
@@ -318,8 +320,10 @@ async def list_inflation_expectations(
             else:
                 # Memory mode (fallback if batch writing not available)
                 request_params["limit"] = 50000
-                results = polygon_client._get(
-                    "/fed/v1/inflation-expectations", params=request_params
+                results = await call_polygon(
+                    polygon_client._get,
+                    "/fed/v1/inflation-expectations",
+                    params=request_params,
                 )
 
                 import json
@@ -339,8 +343,10 @@ async def list_inflation_expectations(
             request_params["limit"] = limit
 
             # Make the request to the inflation expectations endpoint
-            results = polygon_client._get(
-                "/fed/v1/inflation-expectations", params=request_params
+            results = await call_polygon(
+                polygon_client._get,
+                "/fed/v1/inflation-expectations",
+                params=request_params,
             )
 
             import json
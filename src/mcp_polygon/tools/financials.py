@@ -7,7 +7,7 @@ from ..clients import poly_mcp, polygon_client
 from ..formatters import json_to_csv
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..utils import build_params, call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -137,7 +137,8 @@ async def list_stock_financials(
                 )
         else:
             # Single page approach
-            results = polygon_client.vx.list_stock_financials(
+            results = await call_polygon(
+                polygon_client.vx.list_stock_financials,
                 ticker=ticker,
                 cik=cik,
                 company_name=company_name,
@@ -243,7 +244,8 @@ async def list_financials_balance_sheets(
     """
     try:
         # Build the params dictionary with range parameters
-        results = polygon_client._get(
+        results = await call_polygon(
+            polygon_client._get,
             "/stocks/financials/v1/balance-sheets",
             params={
                 **(params or {}),
@@ -372,7 +374,8 @@ async def list_financials_cash_flow_statements(
     """
     try:
         # Build the params dictionary with range parameters
-        results = polygon_client._get(
+        results = await call_polygon(
+            polygon_client._get,
             "/stocks/financials/v1/cash-flow-statements",
             params={
                 **(params or {}),
@@ -501,7 +504,8 @@ async def list_financials_income_statements(
     """
     try:
         # Build the params dictionary with range parameters
-        results = polygon_client._get(
+        results = await call_polygon(
+            polygon_client._get,
             "/stocks/financials/v1/income-statements",
             params={
                 **(params or {}),
@@ -632,8 +636,10 @@ async def list_financials_ratios(
             request_params["sort"] = sort
 
         # Make the request to the financial ratios endpoint
-        results = polygon_client._get(
-            "/vX/reference/financials/ratios", params=request_params
+        results = await call_polygon(
+            polygon_client._get,
+            "/vX/reference/financials/ratios",
+            params=request_params,
         )
 
         # Convert to CSV
@@ -791,7 +797,8 @@ async def list_stock_ratios(
     """
     try:
         # Build the params dictionary with all range parameters
-        results = polygon_client._get(
+        results = await call_polygon(
+            polygon_client._get,
             "/stocks/financials/v1/ratios",
             params={
                 **(params or {}),
@@ -1079,7 +1086,8 @@ async def list_short_interest(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_short_interest(
+            results = await call_polygon(
+                polygon_client.list_short_interest,
                 ticker=ticker,
                 settlement_date=settlement_date,
                 settlement_date_lt=settlement_date_lt,
@@ -1253,7 +1261,8 @@ async def list_short_volume(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_short_volume(
+            results = await call_polygon(
+                polygon_client.list_short_volume,
                 ticker=ticker,
                 date=date,
                 date_lt=date_lt,
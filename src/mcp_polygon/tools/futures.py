@@ -7,7 +7,7 @@ from ..clients import poly_mcp, polygon_client
 from ..formatters import json_to_csv
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..utils import build_params, call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -91,7 +91,8 @@ async def list_futures_aggregates(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_futures_aggregates(
+            results = await call_polygon(
+                polygon_client.list_futures_aggregates,
                 ticker=ticker,
                 resolution=resolution,
                 window_start=window_start,
@@ -202,7 +203,8 @@ async def list_futures_contracts(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_futures_contracts(
+            results = await call_polygon(
+                polygon_client.list_futures_contracts,
                 product_code=product_code,
                 first_trade_date=first_trade_date,
                 last_trade_date=last_trade_date,
@@ -244,14 +246,15 @@ async def get_futures_contract_details(
     Get details for a single futures contract at a specified point in time.
     """
     try:
-        results = polygon_client.get_futures_contract_details(
+        results = await call_polygon(
+            polygon_client.get_futures_contract_details,
             ticker=ticker,
             as_of=as_of,
             params=params,
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -344,7 +347,8 @@ async def list_futures_products(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_futures_products(
+            results = await call_polygon(
+                polygon_client.list_futures_products,
                 name=name,
                 name_search=name_search,
                 as_of=as_of,
@@ -390,7 +394,8 @@ async def get_futures_product_details(
     Get details for a single futures product as it was at a specific day.
     """
     try:
-        results = polygon_client.get_futures_product_details(
+        results = await call_polygon(
+            polygon_client.get_futures_product_details,
             product_code=product_code,
             type=type,
             as_of=as_of,
@@ -398,7 +403,7 @@ async def get_futures_product_details(
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -472,7 +477,8 @@ async def list_futures_schedules(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_futures_schedules(
+            results = await call_polygon(
+                polygon_client.list_futures_schedules,
                 session_end_date=session_end_date,
                 trading_venue=trading_venue,
                 limit=limit,
@@ -577,7 +583,8 @@ async def list_futures_schedules_by_product_code(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_futures_schedules_by_product_code(
+            results = await call_polygon(
+                polygon_client.list_futures_schedules_by_product_code,
                 product_code=product_code,
                 session_end_date=session_end_date,
                 session_end_date_lt=session_end_date_lt,
@@ -674,7 +681,8 @@ async def list_futures_market_statuses(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_futures_market_statuses(
+            results = await call_polygon(
+                polygon_client.list_futures_market_statuses,
                 product_code_any_of=product_code_any_of,
                 product_code=product_code,
                 limit=limit,
@@ -724,7 +732,8 @@ async def get_futures_snapshot(
     Get snapshots for futures contracts.
     """
     try:
-        results = polygon_client.get_futures_snapshot(
+        results = await call_polygon(
+            polygon_client.get_futures_snapshot,
             ticker=ticker,
             ticker_any_of=ticker_any_of,
             ticker_gt=ticker_gt,
@@ -743,7 +752,7 @@ async def get_futures_snapshot(
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
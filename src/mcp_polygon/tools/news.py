@@ -7,7 +7,7 @@ from ..clients import poly_mcp, polygon_client
 from ..formatters import json_to_csv
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..utils import build_params, call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -114,7 +114,8 @@ async def list_ticker_news(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_ticker_news(
+            results = await call_polygon(
+                polygon_client.list_ticker_news,
                 ticker=ticker,
                 published_utc=published_utc,
                 limit=limit,
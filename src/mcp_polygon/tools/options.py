@@ -10,7 +10,7 @@ from ..formatters import (
 )
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..utils import build_params, normalize_date, call_polygon
 import json
 
 
@@ -216,7 +216,8 @@ async def list_options_contracts(
                 )
         else:
             # Single page approach (existing behavior)
-            results = polygon_client.list_options_contracts(
+            results = await call_polygon(
+                polygon_client.list_options_contracts,
                 underlying_ticker=underlying_ticker,
                 contract_type=contract_type,
                 expiration_date=expiration_date,
@@ -270,8 +271,11 @@ async def get_options_contract(
     Returns: type, strike, expiration, exercise_style (american/european), shares_per_contract (usually 100), underlying.
     """
     try:
-        results = polygon_client.get_options_contract(
-            ticker=options_ticker, as_of=as_of, raw=True
+        results = await call_polygon(
+            polygon_client.get_options_contract,
+            ticker=options_ticker,
+            as_of=as_of,
+            raw=True,
         )
 
         # Parse the response and extract the results object
@@ -283,7 +287,7 @@ async def get_options_contract(
             formatted_data = {"results": [data["results"]]}
             return json_to_csv(formatted_data)
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -331,6 +335,11 @@ async def get_options_aggs(
             fetch_all=fetch_all,
         )
 
+        # Canonicalize dates once so every fetch path forwards the same values
+        # (tool_params keeps the caller's strings for cache partition keys)
+        from_ = normalize_date(from_)
+        to = normalize_date(to)
+
         if fetch_all:
             # Use batch writing for memory efficiency
             batch_callback, finalize = create_batch_writer(
@@ -357,7 +366,8 @@ async def get_options_aggs(
                 return await finalize()
             else:
                 # Memory mode (fallback if batch writing not available)
-                aggs_data = polygon_client.get_aggs(
+                aggs_data = await call_polygon(
+                    polygon_client.get_aggs,
                     ticker=options_ticker,
                     multiplier=multiplier,
                     timespan=timespan,
@@ -390,7 +400,8 @@ async def get_options_aggs(
                 )
         else:
             # Single page approach
-            results = polygon_client.get_aggs(
+            results = await call_polygon(
+                polygon_client.get_aggs,
                 ticker=options_ticker,
                 multiplier=multiplier,
                 timespan=timespan,
@@ -441,14 +452,15 @@ async def get_options_daily_open_close(
     Returns: open, high, low, close, volume, preMarket, afterHours (if available).
     """
     try:
-        results = polygon_client.get_daily_open_close_agg(
+        results = await call_polygon(
+            polygon_client.get_daily_open_close_agg,
             ticker=options_ticker,
             date=date,
             adjusted=adjusted,
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -473,13 +485,14 @@ async def get_options_previous_close(
     Returns: T (ticker), o, h, l, c, v, vw (VWAP), n (trades), t (timestamp).
     """
     try:
-        results = polygon_client.get_previous_close_agg(
+        results = await call_polygon(
+            polygon_client.get_previous_close_agg,
             ticker=options_ticker,
             adjusted=adjusted,
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -505,7 +518,8 @@ async def get_options_snapshot(
              Includes enriched GEX and advanced Greeks (charm, vanna, vomma, zomma, speed, color).
     """
     try:
-        results = polygon_client.get_snapshot_option(
+        results = await call_polygon(
+            polygon_client.get_snapshot_option,
             underlying_asset=underlying_asset,
             option_contract=option_contract,
             raw=True,
@@ -523,7 +537,8 @@ async def get_options_snapshot(
         # Get current stock price for GEX/Greeks calculations
         stock_price = None
         try:
-            snapshot_result = polygon_client.get_snapshot_ticker(
+            snapshot_result = await call_polygon(
+                polygon_client.get_snapshot_ticker,
                 market_type="stocks",
                 ticker=underlying_asset,
                 raw=True,
@@ -559,7 +574,7 @@ async def get_options_snapshot(
             formatted_data = {"results": options_list}
             return json_to_csv(formatted_data)
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -735,7 +750,8 @@ async def list_snapshot_options_chain(
                 # Get current stock price by fetching the underlying ticker snapshot
                 stock_price = None
                 try:
-                    snapshot_result = polygon_client.get_snapshot_ticker(
+                    snapshot_result = await call_polygon(
+                        polygon_client.get_snapshot_ticker,
                         market_type="stocks",
                         ticker=underlying_asset,
                         raw=True,
@@ -768,7 +784,8 @@ async def list_snapshot_options_chain(
                 )
         else:
             # Single page approach (existing behavior)
-            results = polygon_client.list_snapshot_options_chain(
+            results = await call_polygon(
+                polygon_client.list_snapshot_options_chain,
                 underlying_asset=underlying_asset,
                 params=param_dict,
                 raw=True,
@@ -781,7 +798,8 @@ async def list_snapshot_options_chain(
             # Get current stock price by fetching the underlying ticker snapshot
             stock_price = None
             try:
-                snapshot_result = polygon_client.get_snapshot_ticker(
+                snapshot_result = await call_polygon(
+                    polygon_client.get_snapshot_ticker,
                     market_type="stocks",
                     ticker=underlying_asset,
                     raw=True,
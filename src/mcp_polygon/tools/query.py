@@ -4,11 +4,12 @@ DuckDB query tool for cached Polygon data.
 Provides SQL query interface to cached Parquet files.
 """
 
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 from mcp.types import ToolAnnotations
 
 from ..clients import poly_mcp
 from ..duckdb_query import get_query_tool
+from ..response_cache import invalidate_tags
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -128,3 +129,32 @@ async def list_cached_data(
 
     except Exception as e:
         return f"Error: {e}"
+
+
+@poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=True))
+async def invalidate_response_cache(tags: List[str]) -> str:
+    """
+    Evict short-lived and historical tool responses cached in memory and on disk.
+
+    Snapshot and daily aggregate tools reuse recent responses for identical
+    calls, and past-date results are kept for days. Use this after a known
+    corporate action (split, dividend) or when fresh data is required.
+
+    Args:
+        tags: Tags to evict; a cached response matching any tag is removed.
+              - "ticker:<symbol>" (e.g., "ticker:AAPL")
+              - "market:<market_type>" (e.g., "market:stocks")
+              - "date:<YYYY-MM-DD>" (e.g., "date:2024-10-25")
+              - "tool:<tool_name>" (e.g., "tool:get_snapshot_direction")
+
+    Returns:
+        Number of cached responses removed
+
+    Example:
+        invalidate_response_cache(tags=["ticker:AAPL"])
+    """
+    try:
+        removed = invalidate_tags(*tags)
+        return f"Removed {removed} cached responses"
+    except Exception as e:
+        return f"Error: {e}"
@@ -7,7 +7,7 @@ from ..clients import poly_mcp, polygon_client
 from ..formatters import json_to_csv
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..utils import build_params, call_polygon
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
@@ -32,10 +32,12 @@ async def get_market_holidays(
     Common US market holidays include New Year's Day, Independence Day, Thanksgiving, and Christmas.
     """
     try:
-        results = polygon_client.get_market_holidays(params=params, raw=True)
+        results = await call_polygon(
+            polygon_client.get_market_holidays, params=params, raw=True
+        )
 
         # Convert to CSV
-        csv_data = json_to_csv(results.data.decode("utf-8"))
+        csv_data = json_to_csv(results.data)
 
         # Process with intelligent caching
         return await process_tool_response(
@@ -55,9 +57,11 @@ async def get_market_status(
     Get current trading status of exchanges and financial markets.
     """
     try:
-        results = polygon_client.get_market_status(params=params, raw=True)
+        results = await call_polygon(
+            polygon_client.get_market_status, params=params, raw=True
+        )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -178,7 +182,8 @@ async def list_tickers(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_tickers(
+            results = await call_polygon(
+                polygon_client.list_tickers,
                 ticker=ticker,
                 type=type,
                 market=market,
@@ -289,7 +294,8 @@ async def get_all_tickers(
                 )
         else:
             # Single page approach
-            results = polygon_client.list_tickers(
+            results = await call_polygon(
+                polygon_client.list_tickers,
                 market=market,
                 type=type,
                 active=active,
@@ -338,8 +344,12 @@ async def get_ticker_details(
     Returns: name, description, market_cap, total_employees, homepage_url, address, cik, sic_code, branding (logo/icon).
     """
     try:
-        results = polygon_client.get_ticker_details(
-            ticker=ticker, date=date, params=params, raw=True
+        results = await call_polygon(
+            polygon_client.get_ticker_details,
+            ticker=ticker,
+            date=date,
+            params=params,
+            raw=True,
         )
 
         # Parse the response and extract the results object
@@ -350,7 +360,7 @@ async def get_ticker_details(
             # Wrap the results object in an array for CSV formatting
             formatted_data = {"results": [data["results"]]}
             return json_to_csv(formatted_data)
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -374,11 +384,11 @@ async def get_related_companies(
     Returns: Array of related ticker symbols (peers, competitors, sector companies).
     """
     try:
-        results = polygon_client.get_related_companies(
-            ticker=ticker, params=params, raw=True
+        results = await call_polygon(
+            polygon_client.get_related_companies, ticker=ticker, params=params, raw=True
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -404,12 +414,16 @@ async def get_ticker_types(
     Returns: code, description, asset_class, locale. Common codes: CS (Common Stock), ETF, REIT, CALL/PUT (options).
     """
     try:
-        results = polygon_client.get_ticker_types(
-            asset_class=asset_class, locale=locale, params=params, raw=True
+        results = await call_polygon(
+            polygon_client.get_ticker_types,
+            asset_class=asset_class,
+            locale=locale,
+            params=params,
+            raw=True,
         )
 
         # Convert to CSV
-        csv_data = json_to_csv(results.data.decode("utf-8"))
+        csv_data = json_to_csv(results.data)
 
         # Process with intelligent caching
         return await process_tool_response(
@@ -449,7 +463,8 @@ async def list_conditions(
     Common examples include codes for extended hours trading, odd lots, and various execution venues.
     """
     try:
-        results = polygon_client.list_conditions(
+        results = await call_polygon(
+            polygon_client.list_conditions,
             asset_class=asset_class,
             data_type=data_type,
             id=id,
@@ -458,7 +473,7 @@ async def list_conditions(
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
@@ -485,12 +500,16 @@ async def get_exchanges(
     Note: MIC (Market Identifier Code) is a unique identifier for each exchange (e.g., XNYS for NYSE).
     """
     try:
-        results = polygon_client.get_exchanges(
-            asset_class=asset_class, locale=locale, params=params, raw=True
+        results = await call_polygon(
+            polygon_client.get_exchanges,
+            asset_class=asset_class,
+            locale=locale,
+            params=params,
+            raw=True,
         )
 
         # Convert to CSV
-        csv_data = json_to_csv(results.data.decode("utf-8"))
+        csv_data = json_to_csv(results.data)
 
         # Process with intelligent caching
         return await process_tool_response(
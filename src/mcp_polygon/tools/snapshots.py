@@ -1,15 +1,230 @@
 """Auto-generated tool definitions."""
 
-from typing import Optional, Any, Dict, List
+import asyncio
+import json
+import traceback
+from typing import Optional, Any, Callable, Dict, List, Literal, Set, Union
 from mcp.types import ToolAnnotations
+from polygon.exceptions import BadResponse
 from ..clients import poly_mcp, polygon_client
-from ..formatters import json_to_csv
+from ..formatters import json_to_arrow_ipc, json_to_csv, json_to_csv_columnar
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..response_cache import TTLCache, conditional_fetch, singleflight, ttl_cached
+from ..utils import build_params, call_polygon, chunked
+
+# Ticker filters longer than this are split into concurrent requests
+TICKER_CHUNK_SIZE = 50
+
+# "Not found" verdicts for unknown symbols, so retries of a misspelled or
+# delisted ticker don't go back to the network. Transient errors (5xx, rate
+# limits) are never stored here.
+_negative_cache = TTLCache(maxsize=1024, ttl=60)
+
+# Accepted get_snapshot_direction arguments, checked before any request
+_DIRECTIONS = frozenset({"gainers", "losers"})
+_DIRECTION_MARKETS = frozenset({"stocks", "crypto", "fx", "forex", "otc", "indices"})
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Return True if an error means the requested symbol does not exist."""
+    return isinstance(error, BadResponse) and "NOT_FOUND" in str(error)
+
+
+async def _fetch_ticker_chunks(
+    method: Callable, ticker_arg: str, tickers: List[str], **kwargs
+) -> Dict[str, Any]:
+    """
+    Fetch a snapshot endpoint for a long ticker list in concurrent chunks.
+
+    Each chunk of TICKER_CHUNK_SIZE tickers is requested in parallel (bounded
+    by call_polygon's semaphore) and the per-chunk result lists are
+    concatenated in ticker order, so the merged payload has the same shape as
+    a single unchunked response.
+
+    Args:
+        method: Bound polygon_client snapshot method
+        ticker_arg: Name of the method's ticker list argument
+        tickers: Tickers to request
+        **kwargs: Remaining arguments forwarded to every chunk request
+
+    Returns:
+        Parsed response of the first chunk with its results list (under
+        "results" or "tickers") extended by the other chunks' results
+    """
+    # The SDK writes each call's filters into its params dict in place, so
+    # every concurrent chunk needs its own copy
+    params = kwargs.pop("params", None)
+    responses = await asyncio.gather(
+        *(
+            call_polygon(
+                method,
+                **{ticker_arg: chunk},
+                **kwargs,
+                params=dict(params) if params else None,
+                raw=True,
+            )
+            for chunk in chunked(tickers, TICKER_CHUNK_SIZE)
+        )
+    )
+    pages = [json.loads(response.data) for response in responses]
+
+    merged = pages[0]
+    list_key = "tickers" if "tickers" in merged else "results"
+    records = list(merged.get(list_key) or [])
+    for page in pages[1:]:
+        records.extend(page.get(list_key) or [])
+    merged[list_key] = records
+    if "count" in merged:
+        merged["count"] = len(records)
+    return merged
+
+
+class SnapshotBatcher:
+    """
+    Coalesce concurrent single-ticker snapshot lookups into one request.
+
+    Lookups submitted in the same event loop iteration (e.g. by one
+    asyncio.gather) open a window of window_ms per market type for more to
+    join; the window is then fetched with a single get_snapshot_all(tickers=...)
+    call, and each caller receives the CSV for its own row, rendered exactly
+    as the single-ticker endpoint would be. A lookup that arrives alone is
+    sent to get_snapshot_ticker at once, without waiting out the window, and
+    any ticker the multi-ticker response leaves out (such as OTC symbols) is
+    retried there too, so every lookup resolves as it would on its own.
+
+    Args:
+        window_ms: How long to wait for more tickers before dispatching
+        max_batch: Dispatch immediately once this many tickers are queued
+    """
+
+    def __init__(self, window_ms: float = 10, max_batch: int = 250):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending: Dict[str, Dict[str, List[asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.Handle] = {}
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def submit(self, ticker: str, market_type: str = "stocks") -> asyncio.Future:
+        """Queue a ticker and return a future resolving to its CSV snapshot."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(market_type, {})
+        pending.setdefault(ticker.upper(), []).append(future)
+
+        if len(pending) >= self.max_batch:
+            self._dispatch(market_type)
+        elif market_type not in self._timers:
+            # Concurrent lookups all submit before this callback runs
+            self._timers[market_type] = loop.call_soon(self._collect, market_type)
+        return future
+
+    def _collect(self, market_type: str) -> None:
+        pending = self._pending.get(market_type)
+        if pending and len(pending) > 1:
+            # Part of a burst: hold the window open for stragglers
+            loop = asyncio.get_running_loop()
+            self._timers[market_type] = loop.call_later(
+                self.window, self._dispatch, market_type
+            )
+        else:
+            self._dispatch(market_type)
+
+    def _dispatch(self, market_type: str) -> None:
+        timer = self._timers.pop(market_type, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(market_type, None)
+        if pending:
+            task = asyncio.create_task(self._flush(market_type, pending))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self, market_type: str, pending: Dict[str, List[asyncio.Future]]
+    ) -> None:
+        if len(pending) > 1:
+            try:
+                response = await call_polygon(
+                    polygon_client.get_snapshot_all,
+                    market_type=market_type,
+                    tickers=list(pending),
+                    raw=True,
+                )
+                rendered = self._split(json.loads(response.data))
+            except Exception as e:
+                # A multi-ticker NOT_FOUND says nothing about any one symbol,
+                # so only the single-ticker endpoint's verdict is reported
+                if not _is_not_found(e):
+                    self._resolve(pending, exception=e)
+                    return
+                rendered = {}
+            for ticker in list(pending):
+                if ticker in rendered:
+                    self._resolve({ticker: pending.pop(ticker)}, rendered[ticker])
+
+        # Lone lookups and tickers the multi-ticker response omitted go through
+        # the single-ticker endpoint, which reports its own errors
+        await asyncio.gather(
+            *(
+                self._fetch_single(market_type, ticker, futures)
+                for ticker, futures in pending.items()
+            )
+        )
+
+    async def _fetch_single(
+        self, market_type: str, ticker: str, futures: List[asyncio.Future]
+    ) -> None:
+        try:
+            response = await call_polygon(
+                polygon_client.get_snapshot_ticker,
+                market_type=market_type,
+                ticker=ticker,
+                raw=True,
+            )
+            csv_data = json_to_csv(response.data)
+        except Exception as e:
+            self._resolve({ticker: futures}, exception=e)
+            return
+        self._resolve({ticker: futures}, csv_data)
+
+    @staticmethod
+    def _resolve(
+        pending: Dict[str, List[asyncio.Future]],
+        result: Optional[str] = None,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        for futures in pending.values():
+            for future in futures:
+                if future.done():
+                    continue
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+
+    @staticmethod
+    def _split(payload: Dict[str, Any]) -> Dict[str, str]:
+        """Render each row of a multi-ticker payload as a single-ticker response."""
+        envelope = {k: v for k, v in payload.items() if k not in ("tickers", "count")}
+        return {
+            row["ticker"]: json_to_csv({"ticker": row, **envelope})
+            for row in payload.get("tickers") or []
+            if "ticker" in row
+        }
+
+
+_ticker_batcher = SnapshotBatcher(window_ms=10, max_batch=250)
+
+
+def _universal_page_csv(data: bytes) -> str:
+    """Render one raw list_universal_snapshots page as CSV."""
+    snapshots_list = json.loads(data).get("results", [])
+    return json_to_csv({"results": snapshots_list, "status": "OK"})
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@singleflight
 async def list_universal_snapshots(
     type: Optional[str] = None,
     ticker: Optional[str] = None,
@@ -31,7 +246,7 @@ async def list_universal_snapshots(
 
     Parameters:
     - type: Asset type ("stocks", "options", "forex", "crypto", "indices")
-    - ticker_any_of: List of specific tickers (up to 250, e.g., ["AAPL", "TSLA"])
+    - ticker_any_of: List of specific tickers (any length; long lists are split into parallel requests, e.g., ["AAPL", "TSLA"])
     - ticker_gte/lt: Ticker range filters
     - limit: Number of results per page (default: 10, max: 250)
     - fetch_all: If True (recommended), fetch ALL data and cache to disk for DuckDB queries (default: True)
@@ -51,20 +266,18 @@ async def list_universal_snapshots(
             fetch_all=fetch_all,
         )
 
-        param_dict = {
-            **(params or {}),
-            **{
-                k: v
-                for k, v in {
-                    "ticker": ticker,
-                    "ticker.gte": ticker_gte,
-                    "ticker.gt": ticker_gt,
-                    "ticker.lte": ticker_lte,
-                    "ticker.lt": ticker_lt,
-                }.items()
-                if v is not None
-            },
-        }
+        # Build the query params in one dict (no temporaries to merge)
+        param_dict = dict(params) if params else {}
+        if ticker is not None:
+            param_dict["ticker"] = ticker
+        if ticker_gte is not None:
+            param_dict["ticker.gte"] = ticker_gte
+        if ticker_gt is not None:
+            param_dict["ticker.gt"] = ticker_gt
+        if ticker_lte is not None:
+            param_dict["ticker.lte"] = ticker_lte
+        if ticker_lt is not None:
+            param_dict["ticker.lt"] = ticker_lt
 
         if fetch_all:
             # Use batch writing for memory efficiency
@@ -99,33 +312,41 @@ async def list_universal_snapshots(
                     sort=sort,
                     params=param_dict,
                 )
-                csv_data = json_to_csv({"results": snapshots_list})
+                csv_data = json_to_csv_columnar({"results": snapshots_list})
                 return await process_tool_response(
                     "list_universal_snapshots", tool_params, csv_data
                 )
+        elif ticker_any_of and len(ticker_any_of) > TICKER_CHUNK_SIZE:
+            # Single page over a long ticker list - fan out chunks in parallel
+            data = await _fetch_ticker_chunks(
+                polygon_client.list_universal_snapshots,
+                "ticker_any_of",
+                ticker_any_of,
+                type=type,
+                order=order,
+                limit=limit,
+                sort=sort,
+                params=param_dict,
+            )
+            snapshots_list = data.get("results", [])[:limit]
+
+            csv_data = json_to_csv({"results": snapshots_list, "status": "OK"})
+            return await process_tool_response(
+                "list_universal_snapshots", tool_params, csv_data
+            )
         else:
             # Single page approach
-            results = polygon_client.list_universal_snapshots(
+            csv_data = await conditional_fetch(
+                polygon_client.list_universal_snapshots,
+                _universal_page_csv,
                 type=type,
                 ticker_any_of=ticker_any_of,
                 order=order,
                 limit=limit,
                 sort=sort,
                 params=param_dict,
-                raw=True,
             )
 
-            import json
-
-            data = json.loads(results.data.decode("utf-8"))
-            snapshots_list = data.get("results", [])
-
-            # Create data structure for JSON to CSV conversion
-            data = {"results": snapshots_list, "status": "OK"}
-
-            # Convert to CSV
-            csv_data = json_to_csv(data)
-
             # Process with intelligent caching
             return await process_tool_response(
                 "list_universal_snapshots", tool_params, csv_data
@@ -134,12 +355,29 @@ async def list_universal_snapshots(
         return f"Error: {e}"
 
 
+def _json_text(payload: Union[bytes, Dict[str, Any]]) -> str:
+    """Return a response as JSON text, passing raw bytes through unparsed."""
+    if isinstance(payload, (bytes, bytearray)):
+        return payload.decode("utf-8")
+    return json.dumps(payload)
+
+
+# get_snapshot_all output formats
+_SNAPSHOT_ENCODERS: Dict[str, Callable[[Any], str]] = {
+    "csv": json_to_csv_columnar,
+    "arrow": json_to_arrow_ipc,
+    "json": _json_text,
+}
+
+
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=15)
 async def get_snapshot_all(
     market_type: str,
     tickers: Optional[List[str]] = None,
     include_otc: Optional[bool] = None,
     params: Optional[Dict[str, Any]] = None,
+    format: Literal["csv", "arrow", "json"] = "csv",
 ) -> str:
     """
     Get full market snapshot for 10,000+ tickers in a single response. Auto-cached to disk for DuckDB queries.
@@ -150,6 +388,7 @@ async def get_snapshot_all(
     - market_type: Market type ("stocks", "crypto", "fx", "otc", "indices")
     - tickers: Optional list to filter specific tickers (e.g., ["AAPL", "TSLA"])
     - include_otc: Include OTC securities (default: False)
+    - format: "csv" (default), "arrow" for a base64 Arrow IPC stream, or "json" for the raw API response; arrow/json are for programmatic clients (not cached to disk)
 
     RECOMMENDED: Use this tool for full market analysis - data is automatically cached locally for efficient DuckDB queries.
 
@@ -158,16 +397,50 @@ async def get_snapshot_all(
 
     Returns: ticker, day (OHLC), min, prevDay, lastTrade, lastQuote, todaysChange, todaysChangePerc. Large dataset.
     """
-    try:
-        results = polygon_client.get_snapshot_all(
-            market_type=market_type,
-            tickers=tickers,
-            include_otc=include_otc,
-            params=params,
-            raw=True,
+    encode = _SNAPSHOT_ENCODERS.get(format)
+    if encode is None:
+        return (
+            f"Error: format must be one of {', '.join(_SNAPSHOT_ENCODERS)}"
+            f", got {format!r}"
         )
 
-        csv_data = json_to_csv(results.data.decode("utf-8"))
+    try:
+        if tickers and len(tickers) > TICKER_CHUNK_SIZE:
+            encoded = encode(
+                await _fetch_ticker_chunks(
+                    polygon_client.get_snapshot_all,
+                    "tickers",
+                    tickers,
+                    market_type=market_type,
+                    include_otc=include_otc,
+                    params=params,
+                )
+            )
+        elif tickers:
+            # Convert straight from the raw bytes (no decoded str copy); an
+            # unchanged snapshot (304) re-serves the last conversion
+            encoded = await conditional_fetch(
+                polygon_client.get_snapshot_all,
+                encode,
+                market_type=market_type,
+                tickers=tickers,
+                include_otc=include_otc,
+                params=params,
+            )
+        else:
+            # Full-market snapshots are too large to hold for revalidation
+            response = await call_polygon(
+                polygon_client.get_snapshot_all,
+                market_type=market_type,
+                tickers=tickers,
+                include_otc=include_otc,
+                params=params,
+                raw=True,
+            )
+            encoded = encode(response.data)
+
+        if format != "csv":
+            return encoded
 
         # Process with intelligent caching - this is a large dataset
         return await process_tool_response(
@@ -177,13 +450,14 @@ async def get_snapshot_all(
                 "tickers": tickers,
                 "include_otc": include_otc,
             },
-            csv_data=csv_data,
+            csv_data=encoded,
         )
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=5, stale=25)
 async def get_snapshot_direction(
     market_type: str,
     direction: str,
@@ -205,21 +479,29 @@ async def get_snapshot_direction(
 
     Returns: ticker, day, min, prevDay, lastTrade, lastQuote, todaysChange, todaysChangePerc. Top 20 by % change.
     """
+    if direction not in _DIRECTIONS:
+        return f"Error: direction must be 'gainers' or 'losers', got {direction!r}"
+    if market_type not in _DIRECTION_MARKETS:
+        return (
+            f"Error: market_type must be one of {', '.join(sorted(_DIRECTION_MARKETS))}"
+            f", got {market_type!r}"
+        )
+
     try:
-        results = polygon_client.get_snapshot_direction(
+        return await conditional_fetch(
+            polygon_client.get_snapshot_direction,
+            json_to_csv,
             market_type=market_type,
             direction=direction,
             include_otc=include_otc,
             params=params,
-            raw=True,
         )
-
-        return json_to_csv(results.data.decode("utf-8"))
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=1, maxsize=2048)
 async def get_snapshot_ticker(
     ticker: str,
     market_type: str = "stocks",
@@ -237,19 +519,39 @@ async def get_snapshot_ticker(
     Example: get_snapshot_ticker("AAPL")
     Example: get_snapshot_ticker("TSLA")
 
+    For many tickers, prefer one list_universal_snapshots(ticker_any_of=[...]) call over repeated get_snapshot_ticker calls.
+
     Returns: day (OHLC), min, prevDay, lastTrade, lastQuote, todaysChange, todaysChangePerc. Real-time or delayed.
     """
+    negative_key = ("ticker", market_type, ticker.upper())
+    cached_error = _negative_cache.get(negative_key)
+    if cached_error is not None:
+        return cached_error
+
     try:
-        results = polygon_client.get_snapshot_ticker(
-            market_type=market_type, ticker=ticker, params=params, raw=True
+        if not params:
+            # Concurrent lookups share one multi-ticker request
+            future = await _ticker_batcher.submit(ticker, market_type)
+            return await future
+
+        results = await call_polygon(
+            polygon_client.get_snapshot_ticker,
+            market_type=market_type,
+            ticker=ticker,
+            params=params,
+            raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
-        return f"Error: {e}"
+        message = f"Error: {e}"
+        if _is_not_found(e):
+            _negative_cache.set(negative_key, message)
+        return message
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@singleflight
 async def get_snapshot_option(
     underlying_asset: str,
     option_contract: str,
@@ -266,31 +568,31 @@ async def get_snapshot_option(
 
     Returns: break_even, greeks, implied_volatility, last_trade, last_quote, open_interest, underlying_asset.
     """
+    negative_key = ("option", underlying_asset.upper(), option_contract)
+    cached_error = _negative_cache.get(negative_key)
+    if cached_error is not None:
+        return cached_error
+
     try:
-        results = polygon_client.get_snapshot_option(
+        results = await call_polygon(
+            polygon_client.get_snapshot_option,
             underlying_asset=underlying_asset,
             option_contract=option_contract,
             params=params,
             raw=True,
         )
 
-        # Parse the response and extract the results object
-        import json
-        import traceback
-
-        data = json.loads(results.data.decode("utf-8"))
-        if "results" in data:
-            # Wrap the results object in an array for CSV formatting
-            formatted_data = {"results": [data["results"]]}
-            return json_to_csv(formatted_data)
-        return json_to_csv(results.data.decode("utf-8"))
+        # json_to_csv wraps the single "results" object into one row itself
+        return json_to_csv(results.data)
     except Exception as e:
-        import traceback
-
-        return f"Error: {e}\nTraceback: {traceback.format_exc()}"
+        message = f"Error: {e}\nTraceback: {traceback.format_exc()}"
+        if _is_not_found(e):
+            _negative_cache.set(negative_key, message)
+        return message
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@singleflight
 async def get_snapshot_crypto_book(
     ticker: str,
     params: Optional[Dict[str, Any]] = None,
@@ -306,16 +608,20 @@ async def get_snapshot_crypto_book(
     Returns: Order book with bids and asks at various price levels.
     """
     try:
-        results = polygon_client.get_snapshot_crypto_book(
-            ticker=ticker, params=params, raw=True
+        results = await call_polygon(
+            polygon_client.get_snapshot_crypto_book,
+            ticker=ticker,
+            params=params,
+            raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@singleflight
 async def get_snapshot_indices(
     ticker_any_of: Optional[List[str]] = None,
     params: Optional[Dict[str, Any]] = None,
@@ -346,18 +652,20 @@ async def get_snapshot_indices(
         if isinstance(ticker_any_of, str):
             ticker_any_of = [ticker_any_of]
 
-        results = polygon_client.get_snapshot_indices(
+        results = await call_polygon(
+            polygon_client.get_snapshot_indices,
             ticker_any_of=ticker_any_of,
             params=params,
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@singleflight
 async def get_summaries(
     ticker_any_of: Optional[List[str]] = None,
     params: Optional[Dict[str, Any]] = None,
@@ -383,12 +691,13 @@ async def get_summaries(
         if isinstance(ticker_any_of, str):
             ticker_any_of = [ticker_any_of]
 
-        results = polygon_client.get_summaries(
+        results = await call_polygon(
+            polygon_client.get_summaries,
             ticker_any_of=ticker_any_of,
             params=params,
             raw=True,
         )
 
-        return json_to_csv(results.data.decode("utf-8"))
+        return json_to_csv(results.data)
     except Exception as e:
         return f"Error: {e}"
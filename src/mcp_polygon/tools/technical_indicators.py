@@ -1,16 +1,151 @@
 """Auto-generated tool definitions."""
 
-from typing import Optional, Any, Dict, Union
+import asyncio
+from typing import Optional, Any, Dict, List, Union
+
+import pyarrow as pa
 from mcp.types import ToolAnnotations
 from datetime import datetime, date
 from ..clients import poly_mcp, polygon_client
-from ..formatters import json_to_csv
+from ..formatters import json_to_csv_columnar
 from ..tool_integration import process_tool_response, create_batch_writer
 from ..parallel_fetcher import PolygonParallelFetcher
-from ..utils import build_params
+from ..response_cache import timespan_ttl, ttl_cached
+from ..utils import build_params, call_polygon, normalize_date
+
+
+# Repeat calls within this window reuse the previous result (the CSV, or the
+# metadata of the Parquet cache a fetch_all call wrote) instead of
+# refetching up to 5000 points. Indicators on short bars move with every
+# bar, so their results are kept briefly.
+INDICATOR_TTL = timespan_ttl("timespan", {"minute": 30, "hour": 300}, default=900)
+
+
+# Parquet types for indicator columns; MACD adds signal and histogram.
+# Without them the cache would store every value as a string.
+INDICATOR_SCHEMA = {
+    "timestamp": pa.int64(),
+    "value": pa.float64(),
+    "signal": pa.float64(),
+    "histogram": pa.float64(),
+}
+
+
+_TIMESPANS = frozenset({"minute", "hour", "day", "week", "month", "quarter", "year"})
+_SERIES_TYPES = frozenset({"close", "open", "high", "low"})
+_ORDERS = frozenset({"asc", "desc"})
+_MAX_LIMIT = 5000
+
+
+def _invalid_argument(
+    timespan: Optional[str], series_type: Optional[str], order: Optional[str]
+) -> Optional[str]:
+    """Return an error message for an argument Polygon would reject, else None."""
+    for name, value, allowed in (
+        ("timespan", timespan, _TIMESPANS),
+        ("series_type", series_type, _SERIES_TYPES),
+        ("order", order, _ORDERS),
+    ):
+        if value is not None and value not in allowed:
+            return (
+                f"Error: {name} must be one of {', '.join(sorted(allowed))}"
+                f", got {value!r}"
+            )
+    return None
+
+
+def _range_params(
+    params: Optional[Dict[str, Any]],
+    timestamp_gte: Optional[Union[str, int, datetime, date]],
+    timestamp_gt: Optional[Union[str, int, datetime, date]],
+    timestamp_lte: Optional[Union[str, int, datetime, date]],
+    timestamp_lt: Optional[Union[str, int, datetime, date]],
+) -> Dict[str, Any]:
+    """
+    Merge the timestamp range filters into a copy of the extra params.
+
+    Filters are normalized here because values in params reach the query
+    string as str(value), so a datetime would otherwise be sent as
+    "2024-01-02 00:00:00". (The tools normalize timestamp the same way: the
+    SDK would send a datetime as nanoseconds, where Polygon expects ms.)
+    """
+    final_params = dict(params) if params else {}
+    if timestamp_gte is not None:
+        final_params["timestamp.gte"] = normalize_date(timestamp_gte)
+    if timestamp_gt is not None:
+        final_params["timestamp.gt"] = normalize_date(timestamp_gt)
+    if timestamp_lte is not None:
+        final_params["timestamp.lte"] = normalize_date(timestamp_lte)
+    if timestamp_lt is not None:
+        final_params["timestamp.lt"] = normalize_date(timestamp_lt)
+    return final_params
+
+
+async def _fetch_indicator(
+    method_name: str,
+    tool_params: Dict[str, Any],
+    indicator_kwargs: Dict[str, Any],
+    limit: Optional[int],
+    fetch_all: Optional[bool],
+) -> str:
+    """
+    Fetch an indicator and return CSV or cache metadata, as every tool here does.
+
+    With fetch_all, pages of 5000 points are streamed to the Parquet cache
+    (or collected in memory if batch writing is unavailable); otherwise a
+    single page of limit points is fetched.
+
+    Args:
+        method_name: polygon_client method and tool name (e.g. "get_sma")
+        tool_params: Parameters identifying the cached result
+        indicator_kwargs: Arguments for the SDK method, excluding limit
+        limit: Page size for the single-page request
+        fetch_all: Fetch every page instead of one
+    """
+    if fetch_all:
+        # Use batch writing for memory efficiency
+        batch_callback, finalize = create_batch_writer(
+            method_name, tool_params, schema=INDICATOR_SCHEMA
+        )
+        fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
+
+        if batch_callback:
+            # Streaming mode - write batches to disk incrementally
+            await fetcher.fetch_all(
+                method_name=method_name,
+                batch_callback=batch_callback,
+                limit=_MAX_LIMIT,
+                **indicator_kwargs,
+            )
+            # Finalize and return cache metadata
+            return await finalize()
+
+        # Memory mode (fallback if batch writing not available)
+        values = await fetcher.fetch_all(
+            method_name=method_name, limit=_MAX_LIMIT, **indicator_kwargs
+        )
+        csv_data = json_to_csv_columnar({"results": values})
+    else:
+        # Single page approach
+        if limit is not None:
+            limit = min(max(limit, 1), _MAX_LIMIT)
+        results = await call_polygon(
+            getattr(polygon_client, method_name),
+            limit=limit,
+            raw=True,
+            **indicator_kwargs,
+        )
+        # Convert to CSV (formatters.py handles technical indicator structure)
+        csv_data = json_to_csv_columnar(results.data)
+
+    # Process with intelligent caching
+    return await process_tool_response(
+        method_name, tool_params, csv_data, schema=INDICATOR_SCHEMA
+    )
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=INDICATOR_TTL, maxsize=512)
 async def get_sma(
     ticker: str,
     timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -50,6 +185,10 @@ async def get_sma(
 
     Returns: timestamp, value. Common windows: 50-day, 200-day. Golden Cross (50>200)=bullish, Death Cross (50<200)=bearish.
     """
+    error = _invalid_argument(timespan, series_type, order)
+    if error:
+        return error
+
     try:
         tool_params = build_params(
             ticker=ticker,
@@ -58,102 +197,32 @@ async def get_sma(
             limit=limit,
             fetch_all=fetch_all,
         )
+        indicator_kwargs = {
+            "ticker": ticker,
+            "timespan": timespan,
+            "adjusted": adjusted,
+            "window": window,
+            "series_type": series_type,
+            "expand_underlying": expand_underlying,
+            "order": order,
+        }
+        if timestamp is not None:
+            indicator_kwargs["timestamp"] = normalize_date(timestamp)
+        final_params = _range_params(
+            params, timestamp_gte, timestamp_gt, timestamp_lte, timestamp_lt
+        )
+        if final_params:
+            indicator_kwargs["params"] = final_params
 
-        # Build params dict for timestamp range filters
-        final_params = {**(params or {})}
-        if timestamp_gte is not None:
-            final_params["timestamp.gte"] = timestamp_gte
-        if timestamp_gt is not None:
-            final_params["timestamp.gt"] = timestamp_gt
-        if timestamp_lte is not None:
-            final_params["timestamp.lte"] = timestamp_lte
-        if timestamp_lt is not None:
-            final_params["timestamp.lt"] = timestamp_lt
-
-        if fetch_all:
-            # Use batch writing for memory efficiency
-            batch_callback, finalize = create_batch_writer("get_sma", tool_params)
-
-            if batch_callback:
-                # Streaming mode - write batches to disk incrementally
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "window": window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                await fetcher.fetch_all(
-                    method_name="get_sma", batch_callback=batch_callback, **fetch_kwargs
-                )
-                # Finalize and return cache metadata
-                return await finalize()
-            else:
-                # Memory mode (fallback if batch writing not available)
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "window": window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                sma_list = await fetcher.fetch_all(
-                    method_name="get_sma", **fetch_kwargs
-                )
-                csv_data = json_to_csv({"results": sma_list})
-                return await process_tool_response("get_sma", tool_params, csv_data)
-        else:
-            # Single page approach
-            kwargs = {
-                "ticker": ticker,
-                "timespan": timespan,
-                "adjusted": adjusted,
-                "window": window,
-                "series_type": series_type,
-                "expand_underlying": expand_underlying,
-                "order": order,
-                "limit": limit,
-                "raw": True,
-            }
-            if timestamp is not None:
-                kwargs["timestamp"] = timestamp
-            if final_params:
-                kwargs["params"] = final_params
-
-            results = polygon_client.get_sma(**kwargs)
-
-            # Convert to CSV (formatters.py handles technical indicator structure)
-            csv_data = json_to_csv(results.data.decode("utf-8"))
-
-            # Process with intelligent caching
-            return await process_tool_response("get_sma", tool_params, csv_data)
+        return await _fetch_indicator(
+            "get_sma", tool_params, indicator_kwargs, limit, fetch_all
+        )
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=INDICATOR_TTL, maxsize=512)
 async def get_ema(
     ticker: str,
     timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -193,6 +262,10 @@ async def get_ema(
 
     Returns: timestamp, value. Common windows: 12, 26 (MACD components), 50, 200. More responsive than SMA.
     """
+    error = _invalid_argument(timespan, series_type, order)
+    if error:
+        return error
+
     try:
         tool_params = build_params(
             ticker=ticker,
@@ -201,102 +274,32 @@ async def get_ema(
             limit=limit,
             fetch_all=fetch_all,
         )
+        indicator_kwargs = {
+            "ticker": ticker,
+            "timespan": timespan,
+            "adjusted": adjusted,
+            "window": window,
+            "series_type": series_type,
+            "expand_underlying": expand_underlying,
+            "order": order,
+        }
+        if timestamp is not None:
+            indicator_kwargs["timestamp"] = normalize_date(timestamp)
+        final_params = _range_params(
+            params, timestamp_gte, timestamp_gt, timestamp_lte, timestamp_lt
+        )
+        if final_params:
+            indicator_kwargs["params"] = final_params
 
-        # Build params dict for timestamp range filters
-        final_params = {**(params or {})}
-        if timestamp_gte is not None:
-            final_params["timestamp.gte"] = timestamp_gte
-        if timestamp_gt is not None:
-            final_params["timestamp.gt"] = timestamp_gt
-        if timestamp_lte is not None:
-            final_params["timestamp.lte"] = timestamp_lte
-        if timestamp_lt is not None:
-            final_params["timestamp.lt"] = timestamp_lt
-
-        if fetch_all:
-            # Use batch writing for memory efficiency
-            batch_callback, finalize = create_batch_writer("get_ema", tool_params)
-
-            if batch_callback:
-                # Streaming mode - write batches to disk incrementally
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "window": window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                await fetcher.fetch_all(
-                    method_name="get_ema", batch_callback=batch_callback, **fetch_kwargs
-                )
-                # Finalize and return cache metadata
-                return await finalize()
-            else:
-                # Memory mode (fallback if batch writing not available)
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "window": window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                ema_list = await fetcher.fetch_all(
-                    method_name="get_ema", **fetch_kwargs
-                )
-                csv_data = json_to_csv({"results": ema_list})
-                return await process_tool_response("get_ema", tool_params, csv_data)
-        else:
-            # Single page approach
-            kwargs = {
-                "ticker": ticker,
-                "timespan": timespan,
-                "adjusted": adjusted,
-                "window": window,
-                "series_type": series_type,
-                "expand_underlying": expand_underlying,
-                "order": order,
-                "limit": limit,
-                "raw": True,
-            }
-            if timestamp is not None:
-                kwargs["timestamp"] = timestamp
-            if final_params:
-                kwargs["params"] = final_params
-
-            results = polygon_client.get_ema(**kwargs)
-
-            # Convert to CSV (formatters.py handles technical indicator structure)
-            csv_data = json_to_csv(results.data.decode("utf-8"))
-
-            # Process with intelligent caching
-            return await process_tool_response("get_ema", tool_params, csv_data)
+        return await _fetch_indicator(
+            "get_ema", tool_params, indicator_kwargs, limit, fetch_all
+        )
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=INDICATOR_TTL, maxsize=512)
 async def get_macd(
     ticker: str,
     timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -339,6 +342,10 @@ async def get_macd(
 
     Returns: timestamp, value (MACD line), signal (signal line), histogram. Bullish: MACD crosses above signal.
     """
+    error = _invalid_argument(timespan, series_type, order)
+    if error:
+        return error
+
     try:
         tool_params = build_params(
             ticker=ticker,
@@ -349,110 +356,34 @@ async def get_macd(
             limit=limit,
             fetch_all=fetch_all,
         )
+        indicator_kwargs = {
+            "ticker": ticker,
+            "timespan": timespan,
+            "adjusted": adjusted,
+            "short_window": short_window,
+            "long_window": long_window,
+            "signal_window": signal_window,
+            "series_type": series_type,
+            "expand_underlying": expand_underlying,
+            "order": order,
+        }
+        if timestamp is not None:
+            indicator_kwargs["timestamp"] = normalize_date(timestamp)
+        final_params = _range_params(
+            params, timestamp_gte, timestamp_gt, timestamp_lte, timestamp_lt
+        )
+        if final_params:
+            indicator_kwargs["params"] = final_params
 
-        # Build params dict for timestamp range filters
-        final_params = {**(params or {})}
-        if timestamp_gte is not None:
-            final_params["timestamp.gte"] = timestamp_gte
-        if timestamp_gt is not None:
-            final_params["timestamp.gt"] = timestamp_gt
-        if timestamp_lte is not None:
-            final_params["timestamp.lte"] = timestamp_lte
-        if timestamp_lt is not None:
-            final_params["timestamp.lt"] = timestamp_lt
-
-        if fetch_all:
-            # Use batch writing for memory efficiency
-            batch_callback, finalize = create_batch_writer("get_macd", tool_params)
-
-            if batch_callback:
-                # Streaming mode - write batches to disk incrementally
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "short_window": short_window,
-                    "long_window": long_window,
-                    "signal_window": signal_window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                await fetcher.fetch_all(
-                    method_name="get_macd",
-                    batch_callback=batch_callback,
-                    **fetch_kwargs,
-                )
-                # Finalize and return cache metadata
-                return await finalize()
-            else:
-                # Memory mode (fallback if batch writing not available)
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "short_window": short_window,
-                    "long_window": long_window,
-                    "signal_window": signal_window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                macd_list = await fetcher.fetch_all(
-                    method_name="get_macd", **fetch_kwargs
-                )
-                csv_data = json_to_csv({"results": macd_list})
-                return await process_tool_response("get_macd", tool_params, csv_data)
-        else:
-            # Single page approach
-            kwargs = {
-                "ticker": ticker,
-                "timespan": timespan,
-                "adjusted": adjusted,
-                "short_window": short_window,
-                "long_window": long_window,
-                "signal_window": signal_window,
-                "series_type": series_type,
-                "expand_underlying": expand_underlying,
-                "order": order,
-                "limit": limit,
-                "raw": True,
-            }
-            if timestamp is not None:
-                kwargs["timestamp"] = timestamp
-            if final_params:
-                kwargs["params"] = final_params
-
-            results = polygon_client.get_macd(**kwargs)
-
-            # Convert to CSV (formatters.py handles technical indicator structure)
-            csv_data = json_to_csv(results.data.decode("utf-8"))
-
-            # Process with intelligent caching
-            return await process_tool_response("get_macd", tool_params, csv_data)
+        return await _fetch_indicator(
+            "get_macd", tool_params, indicator_kwargs, limit, fetch_all
+        )
     except Exception as e:
         return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@ttl_cached(ttl=INDICATOR_TTL, maxsize=512)
 async def get_rsi(
     ticker: str,
     timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -489,6 +420,10 @@ async def get_rsi(
 
     Returns: timestamp, value (RSI 0-100, <30 oversold, >70 overbought)
     """
+    error = _invalid_argument(timespan, series_type, order)
+    if error:
+        return error
+
     try:
         tool_params = build_params(
             ticker=ticker,
@@ -497,96 +432,87 @@ async def get_rsi(
             limit=limit,
             fetch_all=fetch_all,
         )
+        indicator_kwargs = {
+            "ticker": ticker,
+            "timespan": timespan,
+            "adjusted": adjusted,
+            "window": window,
+            "series_type": series_type,
+            "expand_underlying": expand_underlying,
+            "order": order,
+        }
+        if timestamp is not None:
+            indicator_kwargs["timestamp"] = normalize_date(timestamp)
+        final_params = _range_params(
+            params, timestamp_gte, timestamp_gt, timestamp_lte, timestamp_lt
+        )
+        if final_params:
+            indicator_kwargs["params"] = final_params
 
-        # Build params dict for timestamp range filters
-        final_params = {**(params or {})}
-        if timestamp_gte is not None:
-            final_params["timestamp.gte"] = timestamp_gte
-        if timestamp_gt is not None:
-            final_params["timestamp.gt"] = timestamp_gt
-        if timestamp_lte is not None:
-            final_params["timestamp.lte"] = timestamp_lte
-        if timestamp_lt is not None:
-            final_params["timestamp.lt"] = timestamp_lt
-
-        if fetch_all:
-            # Use batch writing for memory efficiency
-            batch_callback, finalize = create_batch_writer("get_rsi", tool_params)
-
-            if batch_callback:
-                # Streaming mode - write batches to disk incrementally
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "window": window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                await fetcher.fetch_all(
-                    method_name="get_rsi", batch_callback=batch_callback, **fetch_kwargs
-                )
-                # Finalize and return cache metadata
-                return await finalize()
-            else:
-                # Memory mode (fallback if batch writing not available)
-                fetcher = PolygonParallelFetcher(polygon_client, num_workers=5)
-
-                # Build kwargs for fetcher
-                fetch_kwargs = {
-                    "ticker": ticker,
-                    "timespan": timespan,
-                    "adjusted": adjusted,
-                    "window": window,
-                    "series_type": series_type,
-                    "expand_underlying": expand_underlying,
-                    "order": order,
-                    "limit": 5000,
-                }
-                if timestamp is not None:
-                    fetch_kwargs["timestamp"] = timestamp
-                if final_params:
-                    fetch_kwargs["params"] = final_params
-
-                rsi_list = await fetcher.fetch_all(
-                    method_name="get_rsi", **fetch_kwargs
-                )
-                csv_data = json_to_csv({"results": rsi_list})
-                return await process_tool_response("get_rsi", tool_params, csv_data)
-        else:
-            # Single page approach
-            kwargs = {
-                "ticker": ticker,
-                "timespan": timespan,
-                "adjusted": adjusted,
-                "window": window,
-                "series_type": series_type,
-                "expand_underlying": expand_underlying,
-                "order": order,
-                "limit": limit,
-                "raw": True,
-            }
-            if timestamp is not None:
-                kwargs["timestamp"] = timestamp
-            if final_params:
-                kwargs["params"] = final_params
-
-            results = polygon_client.get_rsi(**kwargs)
-
-            # Convert to CSV (formatters.py handles technical indicator structure)
-            csv_data = json_to_csv(results.data.decode("utf-8"))
-
-            # Process with intelligent caching
-            return await process_tool_response("get_rsi", tool_params, csv_data)
+        return await _fetch_indicator(
+            "get_rsi", tool_params, indicator_kwargs, limit, fetch_all
+        )
     except Exception as e:
         return f"Error: {e}"
+
+
+@poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+async def get_indicators_bundle(
+    ticker: str,
+    timespan: Optional[str] = "day",
+    sma_window: Optional[int] = 50,
+    ema_window: Optional[int] = 50,
+    rsi_window: Optional[int] = 14,
+    short_window: Optional[int] = 12,
+    long_window: Optional[int] = 26,
+    signal_window: Optional[int] = 9,
+    limit: Optional[int] = 10,
+    fetch_all: Optional[bool] = True,
+    indicators: Optional[List[str]] = None,
+) -> str:
+    """
+    Get SMA, EMA, MACD and RSI for one ticker in a single call, fetched concurrently.
+
+    Use this instead of calling get_sma, get_ema, get_macd and get_rsi one after another:
+    the four requests run in parallel, so the wait is one round trip instead of four.
+
+    Parameters:
+    - ticker: Symbol (e.g., "AAPL" for stocks, "O:SPY241220P00720000" for options)
+    - timespan: Aggregation period ("day", "hour", "minute")
+    - sma_window / ema_window / rsi_window: Periods (defaults: 50, 50, 14)
+    - short_window / long_window / signal_window: MACD periods (defaults: 12, 26, 9)
+    - limit: Number of results per indicator (default: 10, max: 5000)
+    - fetch_all: If True (recommended), fetch maximum data (5000 points) per indicator and cache to disk for DuckDB queries (default: True, as for the individual tools)
+    - indicators: Subset to fetch, any of "sma", "ema", "macd", "rsi" (default: all four)
+
+    Example: get_indicators_bundle("AAPL")
+    Example: get_indicators_bundle("MSFT", timespan="hour", limit=50)
+    Example: get_indicators_bundle("TSLA", indicators=["macd", "rsi"])
+
+    Returns: One section per indicator ("## SMA", "## EMA", "## MACD", "## RSI"), each with that tool's usual output.
+    """
+    common = {"timespan": timespan, "limit": limit, "fetch_all": fetch_all}
+    calls = {
+        "sma": lambda: get_sma(ticker, window=sma_window, **common),
+        "ema": lambda: get_ema(ticker, window=ema_window, **common),
+        "macd": lambda: get_macd(
+            ticker,
+            short_window=short_window,
+            long_window=long_window,
+            signal_window=signal_window,
+            **common,
+        ),
+        "rsi": lambda: get_rsi(ticker, window=rsi_window, **common),
+    }
+    selected = list(dict.fromkeys(name.lower() for name in indicators or calls))
+    unknown = [name for name in selected if name not in calls]
+    if unknown:
+        return (
+            f"Error: unknown indicator(s) {', '.join(unknown)}; "
+            f"choose from {', '.join(calls)}"
+        )
+
+    sections = await asyncio.gather(*(calls[name]() for name in selected))
+    return "\n".join(
+        f"## {name.upper()}\n{section}" for name, section in zip(selected, sections)
+    )
@@ -1,8 +1,36 @@
 """Utility functions for MCP Polygon tools."""
 
 import asyncio
-from typing import Any, Dict
-from functools import wraps
+import contextvars
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+from functools import lru_cache, partial, wraps
+
+T = TypeVar("T")
+
+# Upper bound on concurrent Polygon REST calls across all tools
+POLYGON_MAX_INFLIGHT = int(os.getenv("POLYGON_MAX_INFLIGHT", "20"))
+
+# One limiter per event loop, created on first use: an asyncio.Semaphore binds
+# to the first loop that waits on it, so a module-level one breaks as soon as
+# a restarted server or a fresh test loop hits contention
+_polygon_semaphores = weakref.WeakKeyDictionary()
+
+# Dedicated worker threads for SDK calls, one per in-flight slot. The default
+# executor is capped at min(32, cpu_count + 4) workers, which on small hosts
+# would queue calls behind the semaphore's limit.
+_polygon_executor = ThreadPoolExecutor(
+    max_workers=POLYGON_MAX_INFLIGHT, thread_name_prefix="polygon"
+)
+
+# HTTP status of the last Polygon response on each worker thread. The SDK
+# raises the same BadResponse for every non-200 status, so this is the only
+# way to tell a 304 Not Modified from other errors without a body.
+_response_status = threading.local()
 
 
 def build_params(**kwargs) -> Dict[str, Any]:
@@ -25,6 +53,129 @@ def build_params(**kwargs) -> Dict[str, Any]:
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
+def chunked(items: Sequence[T], size: int) -> List[Sequence[T]]:
+    """
+    Split a sequence into consecutive slices of at most size items.
+
+    Args:
+        items: Sequence to split (e.g. a list of tickers)
+        size: Maximum slice length
+
+    Returns:
+        List of slices in original order
+
+    Example:
+        >>> chunked(["AAPL", "MSFT", "TSLA"], 2)
+        [['AAPL', 'MSFT'], ['TSLA']]
+    """
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def normalize_date(
+    value: Union[str, int, datetime, date, None],
+) -> Union[str, int, None]:
+    """
+    Canonicalize a date-like tool argument into the form Polygon expects.
+
+    Strings and integers (YYYY-MM-DD or Unix ms timestamps) are already in
+    canonical form and are returned unchanged without touching the cache.
+    Dates become ISO strings and datetimes become Unix ms timestamps, matching
+    what the Polygon SDK sends for aggregate ranges.
+
+    Args:
+        value: Date string, Unix ms timestamp, date, datetime, or None
+
+    Returns:
+        ISO date string or Unix ms timestamp (None passes through)
+
+    Example:
+        >>> normalize_date(date(2024, 1, 2))
+        '2024-01-02'
+    """
+    if value is None or isinstance(value, (str, int)):
+        return value
+    return _normalize_date_object(value)
+
+
+@lru_cache(maxsize=2048)
+def _normalize_date_object(value: Union[datetime, date]) -> Union[str, int]:
+    """Convert a date/datetime to Polygon's canonical form (cached)."""
+    # datetime is a subclass of date, so check it first
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return value.isoformat()
+
+
+def _polygon_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's Polygon in-flight limiter."""
+    loop = asyncio.get_running_loop()
+    semaphore = _polygon_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _polygon_semaphores[loop] = asyncio.Semaphore(POLYGON_MAX_INFLIGHT)
+    return semaphore
+
+
+async def call_polygon(method: Callable[..., T], /, *args, **kwargs) -> T:
+    """
+    Run a blocking Polygon SDK call off the event loop, bounded by a semaphore.
+
+    The SDK client is synchronous, so calling it directly from a tool blocks
+    the whole server. Each call is dispatched to a pooled worker thread while
+    holding one of POLYGON_MAX_INFLIGHT slots, so bursts of tool invocations
+    queue up locally instead of all hitting the API at once. HTTP 429/5xx
+    retries with backoff are already handled by the SDK's urllib3 pool.
+
+    Args:
+        method: Bound polygon_client method (e.g. polygon_client.get_aggs)
+        *args: Positional arguments forwarded to method
+        **kwargs: Keyword arguments forwarded to method
+
+    Returns:
+        Whatever method returns
+
+    Example:
+        >>> results = await call_polygon(polygon_client.get_aggs, ticker="AAPL", ...)
+    """
+    async with _polygon_semaphore():
+        # Like asyncio.to_thread, but on the Polygon pool
+        loop = asyncio.get_running_loop()
+        call = partial(contextvars.copy_context().run, method, *args, **kwargs)
+        return await loop.run_in_executor(_polygon_executor, call)
+
+
+def record_response_status(request: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap a urllib3 request method so each response's status is remembered.
+
+    Args:
+        request: The SDK pool manager's request method
+
+    Returns:
+        A drop-in replacement that stores the status for last_response_status
+
+    Example:
+        >>> pool_manager.request = record_response_status(pool_manager.request)
+    """
+
+    @wraps(request)
+    def wrapper(*args, **kwargs):
+        response = request(*args, **kwargs)
+        _response_status.value = response.status
+        return response
+
+    return wrapper
+
+
+def last_response_status() -> Optional[int]:
+    """Return the status of the last recorded response on this thread."""
+    return getattr(_response_status, "value", None)
+
+
+def clear_response_status() -> None:
+    """Forget this thread's recorded status before a new request."""
+    _response_status.value = None
+
+
 def handle_cancellation(func):
     """
     Decorator to ensure asyncio.CancelledError propagates immediately.
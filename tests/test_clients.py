@@ -0,0 +1,53 @@
+"""Test shared Polygon client configuration."""
+
+from unittest.mock import Mock
+
+from mcp_polygon.clients import http_session, polygon_client
+from mcp_polygon.utils import (
+    POLYGON_MAX_INFLIGHT,
+    last_response_status,
+    record_response_status,
+)
+
+
+def test_connection_pools_sized_for_inflight_calls():
+    """Test that concurrent calls can each keep a pooled connection alive."""
+    for pool_manager in (polygon_client.client, polygon_client.vx.client):
+        pool = pool_manager.connection_from_host(
+            polygon_client.BASE.split("://")[1], 443, "https"
+        )
+        assert pool.pool.maxsize == POLYGON_MAX_INFLIGHT
+
+
+def test_tool_modules_share_one_polygon_client():
+    """Test that every tool module reuses the single pooled RESTClient."""
+    from mcp_polygon import tools
+
+    for module in vars(tools).values():
+        if hasattr(module, "polygon_client"):
+            assert module.polygon_client is polygon_client
+
+
+def test_http_session_keeps_connections_alive():
+    """Test that the shared requests session pools HTTPS connections."""
+    adapter = http_session.get_adapter("https://www.alphavantage.co/query")
+    assert adapter._pool_maxsize == POLYGON_MAX_INFLIGHT
+    assert http_session.headers["Connection"] == "keep-alive"
+
+
+def test_polygon_requests_advertise_every_decodable_encoding():
+    """Test that both REST clients accept every codec urllib3 can decode."""
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    for client in (polygon_client, polygon_client.vx):
+        assert client._concat_headers({})["Accept-Encoding"] == ACCEPT_ENCODING
+
+
+def test_polygon_pools_record_response_status():
+    """Test that both REST clients record each response's HTTP status."""
+    for pool_manager in (polygon_client.client, polygon_client.vx.client):
+        assert hasattr(pool_manager.request, "__wrapped__")
+
+    request = Mock(return_value=Mock(status=304))
+    record_response_status(request)("GET", "https://api.polygon.io/v1/x")
+    assert last_response_status() == 304
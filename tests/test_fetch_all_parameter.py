@@ -86,6 +86,35 @@ async def test_get_aggs_with_fetch_all_false():
         assert len(result) > 0
 
 
+@pytest.mark.asyncio
+async def test_get_aggs_repeat_historical_call_served_from_cache():
+    """Test that re-querying a closed date range skips the API."""
+    from mcp_polygon.tools import aggregates
+    from mcp_polygon.clients import polygon_client
+
+    aggregates.get_aggs.cache.clear()
+    mock_response = create_mock_response(
+        [{"t": 1, "o": 100, "h": 105, "l": 99, "c": 103, "v": 1000}]
+    )
+
+    with patch.object(
+        polygon_client, "get_aggs", return_value=mock_response
+    ) as mock_get:
+        args = dict(
+            ticker="AAPL",
+            multiplier=1,
+            timespan="day",
+            from_="2024-02-01",
+            to="2024-02-29",
+            fetch_all=False,
+        )
+        first = await aggregates.get_aggs(**args)
+        second = await aggregates.get_aggs(**args)
+
+    assert first == second
+    mock_get.assert_called_once()
+
+
 # ============================================================================
 # REFERENCE DATA MODULE TESTS
 # ============================================================================
@@ -1,10 +1,18 @@
 import json
 import csv
+import base64
 import io
 
+import pyarrow.ipc as pa_ipc
 import pytest
 
-from mcp_polygon.formatters import json_to_csv, _flatten_dict
+from mcp_polygon import formatters
+from mcp_polygon.formatters import (
+    json_to_arrow_ipc,
+    json_to_csv,
+    json_to_csv_columnar,
+    _flatten_dict,
+)
 
 
 class TestFlattenDict:
@@ -193,6 +201,37 @@ class TestJsonToCsvStdlib:
         assert rows[0]["ticker"] == "AAPL"
         assert rows[0]["price"] == "150.5"
 
+    def test_json_bytes_input(self):
+        """Test that raw UTF-8 response bytes are parsed without decoding."""
+        json_bytes = '{"results": [{"ticker": "AAPL", "name": "Café"}]}'.encode()
+        results = json_to_csv(json_bytes)
+
+        rows = list(csv.DictReader(io.StringIO(results)))
+
+        assert rows == [{"ticker": "AAPL", "name": "Café"}]
+
+    def test_snapshot_tickers_become_rows(self):
+        """Test that v2 snapshot payloads render one row per ticker."""
+        json_input = {
+            "status": "OK",
+            "count": 2,
+            "tickers": [
+                {"ticker": "AAPL", "day": {"c": 150.5}, "todaysChangePerc": 1.2},
+                {"ticker": "MSFT", "day": {"c": 300.25}, "todaysChangePerc": -0.4},
+            ],
+        }
+
+        assert json_to_csv(json_input) == (
+            "ticker,day_c,todaysChangePerc\nAAPL,150.5,1.2\nMSFT,300.25,-0.4\n"
+        )
+
+    def test_dict_input_is_not_mutated(self):
+        """Test that caller-owned records are left nested after conversion."""
+        json_dict = {"results": [{"ticker": "AAPL", "day": {"o": 1.5}}]}
+        json_to_csv(json_dict)
+
+        assert json_dict == {"results": [{"ticker": "AAPL", "day": {"o": 1.5}}]}
+
     def test_json_dict_input(self):
         """Test that dict input works directly."""
         json_dict = {"results": [{"ticker": "AAPL", "price": 150.5}]}
@@ -424,3 +463,107 @@ class TestJsonToCsvStdlib:
         assert rows[0]["name"] == "Café"
         assert rows[0]["symbol"] == "€"
         assert rows[0]["emoji"] == "🚀"
+
+    def test_consecutive_calls_do_not_leak_rows(self):
+        """Test that the reused CSV buffer is emptied between calls."""
+        first = json_to_csv({"results": [{"a": 1, "b": 2}, {"a": 3, "b": 4}]})
+        second = json_to_csv({"results": [{"x": "only"}]})
+
+        assert first == "a,b\n1,2\n3,4\n"
+        assert second == "x\nonly\n"
+
+
+class TestJsonToCsvColumnar:
+    """Tests for the Arrow-backed json_to_csv_columnar function."""
+
+    @pytest.fixture(autouse=True)
+    def small_threshold(self, monkeypatch):
+        monkeypatch.setattr(formatters, "COLUMNAR_MIN_ROWS", 1)
+
+    def test_matches_json_to_csv_for_grouped_daily_bars(self):
+        """Test that flat OHLCV bars render exactly as json_to_csv does."""
+        payload = {
+            "results": [
+                {"T": "AAPL", "o": 150.25, "c": 151, "v": 1000, "otc": True},
+                {"T": "MSFT", "o": 300.5, "c": 301.75, "v": 2000},
+            ]
+        }
+        raw = json.dumps(payload).encode()
+
+        assert json_to_csv_columnar(raw) == json_to_csv(raw)
+
+    def test_indicator_values(self):
+        """Test that indicator 'values' render like json_to_csv (MACD shape)."""
+        payload = {
+            "results": {
+                "underlying": {"url": "https://api.polygon.io/v2/aggs/..."},
+                "values": [
+                    {"timestamp": 1, "value": 1.25, "signal": 0.5, "histogram": 0.75},
+                    {"timestamp": 2, "value": 1.5, "signal": 0.25, "histogram": 1.25},
+                ],
+            }
+        }
+        raw = json.dumps(payload).encode()
+
+        assert json_to_csv_columnar(raw) == json_to_csv(raw)
+
+    def test_flattens_nested_objects(self):
+        """Test that nested snapshot fields become parent_child columns."""
+        records = [
+            {"ticker": "AAPL", "day": {"o": 1.5, "c": 2.5}},
+            {"ticker": "MSFT", "day": {"o": 3.5, "c": 4.5}},
+        ]
+
+        assert json_to_csv_columnar(records) == (
+            "ticker,day_o,day_c\nAAPL,1.5,2.5\nMSFT,3.5,4.5\n"
+        )
+
+    @pytest.mark.parametrize(
+        "records",
+        [
+            [{"ticker": "A,B"}],
+            [{"conditions": [1, 2]}],
+            [{"value": 1}, {"value": "x"}],
+        ],
+    )
+    def test_falls_back_to_json_to_csv(self, records):
+        """Test that quoting, lists and mixed types use the generic path."""
+        assert json_to_csv_columnar(records) == json_to_csv(records)
+
+    def test_small_batches_use_json_to_csv(self, monkeypatch):
+        """Test that batches below the threshold skip Arrow entirely."""
+        monkeypatch.setattr(formatters, "COLUMNAR_MIN_ROWS", 3)
+        monkeypatch.setattr(formatters, "_records_to_csv_arrow", None)
+
+        assert json_to_csv_columnar([{"a": 1.0}]) == "a\n1.0\n"
+
+
+class TestJsonToArrowIpc:
+    """Test the base64 Arrow IPC output format."""
+
+    @staticmethod
+    def read(encoded):
+        return pa_ipc.open_stream(base64.b64decode(encoded)).read_all()
+
+    def test_roundtrip_flattens_nested_columns(self):
+        """Test that nested objects become parent_child typed columns."""
+        data = {
+            "tickers": [
+                {"ticker": "AAPL", "day": {"c": 150.5, "v": 1000}},
+                {"ticker": "MSFT", "day": {"c": 300.25, "v": 2000}},
+            ]
+        }
+        table = self.read(json_to_arrow_ipc(json.dumps(data).encode("utf-8")))
+
+        assert table.column_names == ["ticker", "day_c", "day_v"]
+        assert table.column("day_c").to_pylist() == [150.5, 300.25]
+        assert table.column("day_v").type == "int64"
+
+    def test_lists_are_kept(self):
+        """Test that list values stay lists instead of being stringified."""
+        table = self.read(json_to_arrow_ipc({"results": [{"c": [1, 2]}]}))
+        assert table.column("c").to_pylist() == [[1, 2]]
+
+    def test_empty_results(self):
+        """Test that an empty result set encodes an empty table."""
+        assert self.read(json_to_arrow_ipc({"results": []})).num_rows == 0
@@ -3,6 +3,7 @@ Test parallel fetcher functionality.
 """
 
 import asyncio
+import threading
 from unittest.mock import Mock
 from mcp_polygon.parallel_fetcher import ParallelFetcher, PolygonParallelFetcher
 
@@ -110,9 +111,30 @@ def test_polygon_parallel_fetcher_vx_client():
     mock_client.vx.list_ipos.assert_called_once()
 
 
+def test_polygon_parallel_fetcher_uses_polygon_pool():
+    """Test that Polygon pages run on the shared, bounded Polygon pool."""
+    threads = []
+    mock_response = Mock()
+    mock_response.data = b'{"results": [{"ticker": "AAPL"}], "next_url": null}'
+
+    def list_tickers(**kwargs):
+        threads.append(threading.current_thread().name)
+        return mock_response
+
+    mock_client = Mock()
+    mock_client.list_tickers = list_tickers
+    fetcher = PolygonParallelFetcher(mock_client, num_workers=5)
+
+    results = asyncio.run(fetcher.fetch_all("list_tickers", market="stocks"))
+
+    assert [r["ticker"] for r in results] == ["AAPL"]
+    assert len(threads) == 1 and threads[0].startswith("polygon")
+
+
 if __name__ == "__main__":
     test_parallel_fetcher_single_page()
     test_parallel_fetcher_multiple_pages()
     test_polygon_parallel_fetcher_create_function()
     test_polygon_parallel_fetcher_vx_client()
+    test_polygon_parallel_fetcher_uses_polygon_pool()
     print("✓ All tests passed!")
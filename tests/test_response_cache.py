@@ -0,0 +1,455 @@
+"""Test the in-process TTL cache for tool responses."""
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+import pytest
+from polygon.exceptions import BadResponse
+
+from mcp_polygon import response_cache, utils
+from mcp_polygon.response_cache import (
+    DiskCache,
+    TTLCache,
+    cache_tags,
+    conditional_fetch,
+    date_ttl,
+    invalidate_tags,
+    singleflight,
+    ttl_cached,
+)
+
+
+class FakeClock:
+    """Controllable replacement for the cache's monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache, "monotonic", fake)
+    return fake
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction."""
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Test that entries disappear once their TTL has elapsed."""
+        cache = TTLCache(maxsize=4, ttl=15)
+        cache.set("k", "v")
+        clock.now += 14
+        assert cache.get("k") == "v"
+        clock.now += 1
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test that the least recently used entry is evicted at maxsize."""
+        cache = TTLCache(maxsize=2, ttl=15)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestTTLCached:
+    """Test the ttl_cached tool decorator."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_hit_cache(self, clock):
+        """Test that a repeat call with equal arguments skips the tool body."""
+        calls = []
+
+        @ttl_cached(ttl=15)
+        async def tool(market_type: str, tickers=None, params=None) -> str:
+            calls.append(market_type)
+            return f"csv-{len(calls)}"
+
+        first = await tool("stocks", tickers=["AAPL"], params={"a": 1})
+        second = await tool("stocks", ["AAPL"], {"a": 1})
+        assert first == second == "csv-1"
+        assert await tool("crypto") == "csv-2"
+
+        clock.now += 16
+        assert await tool("stocks", tickers=["AAPL"], params={"a": 1}) == "csv-3"
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, clock):
+        """Test that error strings are recomputed on the next call."""
+        calls = []
+
+        @ttl_cached(ttl=15)
+        async def tool(ticker: str) -> str:
+            calls.append(ticker)
+            return "Error: boom"
+
+        await tool("AAPL")
+        await tool("AAPL")
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self, clock):
+        """Test that concurrent identical calls trigger a single fetch."""
+        calls = []
+
+        @ttl_cached(ttl=15)
+        async def tool(ticker: str) -> str:
+            calls.append(ticker)
+            await asyncio.sleep(0.01)
+            return "csv"
+
+        results = await asyncio.gather(*(tool("AAPL") for _ in range(5)))
+        assert results == ["csv"] * 5
+        assert len(calls) == 1
+
+
+class TestStaleWhileRevalidate:
+    """Test serving stale results while refreshing in the background."""
+
+    @pytest.mark.asyncio
+    async def test_stale_result_served_then_refreshed(self, clock):
+        """Test that a stale hit returns at once and refreshes behind it."""
+        calls = []
+
+        @ttl_cached(ttl=5, stale=25)
+        async def tool(direction: str) -> str:
+            calls.append(direction)
+            return f"csv-{len(calls)}"
+
+        assert await tool("gainers") == "csv-1"
+
+        clock.now += 10
+        assert await tool("gainers") == "csv-1"
+        assert await tool("gainers") == "csv-1"
+        await asyncio.sleep(0)
+        assert len(calls) == 2
+        assert await tool("gainers") == "csv-2"
+
+    @pytest.mark.asyncio
+    async def test_past_stale_window_fetches_in_foreground(self, clock):
+        """Test that results older than ttl + stale are refetched before returning."""
+        calls = []
+
+        @ttl_cached(ttl=5, stale=25)
+        async def tool(direction: str) -> str:
+            calls.append(direction)
+            return f"csv-{len(calls)}"
+
+        await tool("losers")
+        clock.now += 31
+        assert await tool("losers") == "csv-2"
+
+
+class TestPersistentCache:
+    """Test the on-disk tier for immutable historical results."""
+
+    @pytest.fixture
+    def disk(self, tmp_path, monkeypatch):
+        disk = DiskCache(tmp_path / "responses.sqlite3")
+        monkeypatch.setattr(response_cache, "_disk_cache", disk)
+        return disk
+
+    def test_disk_cache_round_trip_and_expiry(self, tmp_path, monkeypatch):
+        """Test that stored values are read back until they expire."""
+        disk = DiskCache(tmp_path / "responses.sqlite3", ttl=60)
+        disk.set("k", "csv")
+        assert disk.get("k") == "csv"
+        assert DiskCache(disk.path).get("k") == "csv"
+
+        now = response_cache.time.time()
+        monkeypatch.setattr(response_cache.time, "time", lambda: now + 61)
+        assert disk.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_historical_results_survive_restart(self, clock, disk):
+        """Test that a fresh in-memory cache reads past-date results from disk."""
+        calls = []
+
+        async def tool(ticker: str, date: str) -> str:
+            calls.append(ticker)
+            return "csv"
+
+        ttl = date_ttl("date", recent=60)
+        first = ttl_cached(ttl=ttl, persist=True)(tool)
+        restarted = ttl_cached(ttl=ttl, persist=True)(tool)
+
+        assert await first("AAPL", "2023-01-09") == "csv"
+        assert await restarted("AAPL", "2023-01-09") == "csv"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_recent_results_are_not_persisted(self, clock, disk):
+        """Test that today's (still changing) results stay in memory only."""
+
+        @ttl_cached(ttl=date_ttl("date", recent=60), persist=True)
+        async def tool(ticker: str, date: str) -> str:
+            return "csv"
+
+        await tool("AAPL", date.today().isoformat())
+        assert disk._conn is None
+
+
+class TestTagInvalidation:
+    """Test evicting cached results by ticker, market, date or tool."""
+
+    def test_tags_derived_from_arguments(self):
+        """Test that ticker lists, market and date arguments become tags."""
+        key = (("market_type", "stocks"), ("params", None), ("tickers", ("A", "B")))
+        assert cache_tags("get_snapshot_all", key) == {
+            "tool:get_snapshot_all",
+            "market:stocks",
+            "ticker:a",
+            "ticker:b",
+        }
+
+    @pytest.mark.asyncio
+    async def test_invalidate_evicts_matching_entries(
+        self, clock, tmp_path, monkeypatch
+    ):
+        """Test that only entries carrying the tag are refetched."""
+        monkeypatch.setattr(
+            response_cache, "_disk_cache", DiskCache(tmp_path / "responses.sqlite3")
+        )
+        calls = []
+
+        @ttl_cached(ttl=60)
+        async def tagged_tool(ticker: str, market_type: str = "stocks") -> str:
+            calls.append(ticker)
+            return f"csv-{ticker}"
+
+        await tagged_tool("AAPL")
+        await tagged_tool("MSFT")
+
+        # Tags match regardless of case
+        assert invalidate_tags("ticker:aapl") >= 1
+        await tagged_tool("AAPL")
+        await tagged_tool("MSFT")
+        assert calls == ["AAPL", "MSFT", "AAPL"]
+
+    def test_disk_cache_invalidate(self, tmp_path):
+        """Test that persisted entries are removed by tag, in any case."""
+        disk = DiskCache(tmp_path / "responses.sqlite3")
+        disk.set("a", "csv", {"ticker:AAPL", "date:2023-01-09"})
+        disk.set("b", "csv", {"ticker:AAPLX", "date:2023-01-09"})
+
+        assert disk.invalidate(["ticker:aapl"]) == 1
+        assert disk.get("a") is None
+        assert disk.get("b") == "csv"
+
+
+class TestConditionalFetch:
+    """Test ETag revalidation of upstream responses."""
+
+    @staticmethod
+    def response(body, etag=None, last_modified=None):
+        response = Mock()
+        response.data = body
+        response.headers = {}
+        if etag:
+            response.headers["ETag"] = etag
+        if last_modified:
+            response.headers["Last-Modified"] = last_modified
+        return response
+
+    @staticmethod
+    def upstream(*outcomes):
+        """Mock an SDK method; an int outcome is an empty-body error status."""
+        outcomes = list(outcomes)
+
+        def call(**kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, int):
+                utils._response_status.value = outcome
+                raise BadResponse("")
+            utils._response_status.value = 200
+            return outcome
+
+        return Mock(side_effect=call)
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_rendered_result(self):
+        """Test that a 304 re-serves the last render with If-None-Match sent."""
+        renders = []
+
+        def render(data):
+            renders.append(data)
+            return data.decode()
+
+        method = self.upstream(self.response(b"v1", etag='"abc"'), 304)
+
+        assert await conditional_fetch(method, render, ticker="AAPL") == "v1"
+        assert await conditional_fetch(method, render, ticker="AAPL") == "v1"
+
+        assert renders == [b"v1"]
+        assert method.call_args_list[0].kwargs["options"] is None
+        options = method.call_args_list[1].kwargs["options"]
+        assert options.headers == {"If-None-Match": '"abc"'}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_last_modified(self):
+        """Test that If-Modified-Since is sent when there is no ETag."""
+        stamp = "Wed, 14 Oct 2026 20:00:00 GMT"
+        method = self.upstream(self.response(b"v1", last_modified=stamp), 304)
+
+        await conditional_fetch(method, bytes.decode, ticker="NVDA")
+        assert await conditional_fetch(method, bytes.decode, ticker="NVDA") == "v1"
+
+        options = method.call_args_list[1].kwargs["options"]
+        assert options.headers == {"If-Modified-Since": stamp}
+
+    @pytest.mark.asyncio
+    async def test_last_modified_requires_real_not_modified(self):
+        """Test that an empty-body 429 after If-Modified-Since still raises."""
+        stamp = "Wed, 14 Oct 2026 20:00:00 GMT"
+        method = self.upstream(self.response(b"v1", last_modified=stamp), 429)
+
+        await conditional_fetch(method, bytes.decode, ticker="INTC")
+        with pytest.raises(BadResponse):
+            await conditional_fetch(method, bytes.decode, ticker="INTC")
+        options = method.call_args_list[1].kwargs["options"]
+        assert options.headers == {"If-Modified-Since": stamp}
+
+    @pytest.mark.asyncio
+    async def test_without_validators_always_refetches(self):
+        """Test that responses without a validator are never revalidated."""
+        method = Mock(side_effect=[self.response(b"v1"), self.response(b"v2")])
+
+        assert await conditional_fetch(method, bytes.decode, ticker="MSFT") == "v1"
+        assert await conditional_fetch(method, bytes.decode, ticker="MSFT") == "v2"
+        assert method.call_args_list[1].kwargs["options"] is None
+
+    @pytest.mark.asyncio
+    async def test_large_results_are_not_kept(self, monkeypatch):
+        """Test that oversized results are refetched rather than held."""
+        monkeypatch.setattr(response_cache, "_MAX_REVALIDATED_SIZE", 2)
+        method = Mock(
+            side_effect=[
+                self.response(b"big", etag='"abc"'),
+                self.response(b"big", etag='"abc"'),
+            ]
+        )
+
+        await conditional_fetch(method, bytes.decode, ticker="SPY")
+        assert await conditional_fetch(method, bytes.decode, ticker="SPY") == "big"
+        assert method.call_args_list[1].kwargs["options"] is None
+
+    @pytest.mark.asyncio
+    async def test_bodiless_errors_are_not_mistaken_for_not_modified(self):
+        """Test that an empty-body 502 on revalidation still raises."""
+        method = self.upstream(self.response(b"v1", etag='"abc"'), 502)
+
+        await conditional_fetch(method, bytes.decode, ticker="AMD")
+        with pytest.raises(BadResponse):
+            await conditional_fetch(method, bytes.decode, ticker="AMD")
+
+    @pytest.mark.asyncio
+    async def test_invalidated_tags_drop_validators(self, tmp_path, monkeypatch):
+        """Test that invalidating a ticker forgets its revalidation state."""
+        monkeypatch.setattr(
+            response_cache, "_disk_cache", DiskCache(tmp_path / "responses.sqlite3")
+        )
+        method = self.upstream(
+            self.response(b"v1", etag='"abc"'), self.response(b"v2", etag='"def"')
+        )
+        method.__name__ = "get_previous_close_agg"
+
+        await conditional_fetch(method, bytes.decode, ticker="AAPL")
+        invalidate_tags("ticker:AAPL")
+        assert await conditional_fetch(method, bytes.decode, ticker="AAPL") == "v2"
+        assert method.call_args_list[1].kwargs["options"] is None
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_masked(self):
+        """Test that real error responses still propagate."""
+        method = Mock(
+            side_effect=[
+                self.response(b"v1", etag='"abc"'),
+                BadResponse('{"status":"ERROR"}'),
+            ]
+        )
+
+        await conditional_fetch(method, bytes.decode, ticker="TSLA")
+        with pytest.raises(BadResponse):
+            await conditional_fetch(method, bytes.decode, ticker="TSLA")
+
+
+class TestSingleflight:
+    """Test collapsing of concurrent identical calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that overlapping identical calls run the body once."""
+        calls = []
+
+        @singleflight
+        async def tool(ticker: str, market_type: str = "stocks") -> str:
+            calls.append(ticker)
+            await asyncio.sleep(0.01)
+            return f"csv-{ticker}"
+
+        results = await asyncio.gather(
+            tool("AAPL"), tool("AAPL", "stocks"), tool(ticker="AAPL"), tool("MSFT")
+        )
+        assert results == ["csv-AAPL", "csv-AAPL", "csv-AAPL", "csv-MSFT"]
+        assert calls == ["AAPL", "MSFT"]
+
+    @pytest.mark.asyncio
+    async def test_results_are_not_kept(self):
+        """Test that a later call after completion fetches again."""
+        calls = []
+
+        @singleflight
+        async def tool(ticker: str) -> str:
+            calls.append(ticker)
+            return "csv"
+
+        await tool("AAPL")
+        await asyncio.sleep(0)
+        await tool("AAPL")
+        assert len(calls) == 2
+        assert tool.inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that one caller's cancellation leaves the shared call running."""
+        release = asyncio.Event()
+
+        @singleflight
+        async def tool(ticker: str) -> str:
+            await release.wait()
+            return "csv"
+
+        first = asyncio.ensure_future(tool("AAPL"))
+        second = asyncio.ensure_future(tool("AAPL"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "csv"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestDateTTL:
+    """Test date-dependent TTL selection."""
+
+    def test_past_dates_use_historical_ttl(self):
+        ttl = date_ttl("date", recent=60)
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        assert ttl({"date": yesterday}) == response_cache.HISTORICAL_TTL
+
+    def test_today_and_invalid_dates_use_recent_ttl(self):
+        ttl = date_ttl("date", recent=60)
+        assert ttl({"date": date.today().isoformat()}) == 60
+        assert ttl({"date": "not-a-date"}) == 60
+        assert ttl({"date": None}) == 60
@@ -268,6 +268,29 @@ class TestScreenContrarian:
         scored = _score_contrarian_signal([], max_results=10)
         assert scored == []
 
+    @pytest.mark.asyncio
+    async def test_batch_fetch_overlaps_requests(self):
+        """Test that per-ticker indicator lookups run concurrently."""
+        import threading
+        from types import SimpleNamespace
+
+        from src.mcp_polygon.screeners import contrarian_entry
+
+        # Every call must be in flight at once for the barrier to release
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_get_rsi(ticker, **kwargs):
+            barrier.wait()
+            value = SimpleNamespace(value={"AAA": 25.0, "BBB": 50.0}.get(ticker))
+            return SimpleNamespace(values=[value] if value.value else [])
+
+        with patch.object(
+            contrarian_entry.polygon_client, "get_rsi", side_effect=fake_get_rsi
+        ):
+            result = await contrarian_entry._batch_fetch_rsi(["AAA", "BBB", "CCC"])
+
+        assert result == {"AAA": 25.0, "BBB": 50.0}
+
 
 # Earnings screener tests
 class TestEarningsScreener:
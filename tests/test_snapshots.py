@@ -0,0 +1,413 @@
+"""Test snapshot tools that fan out long ticker lists."""
+
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pyarrow.ipc as pa_ipc
+import pytest
+from polygon.exceptions import BadResponse
+
+from mcp_polygon.clients import polygon_client
+from mcp_polygon.tools import snapshots
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshot_caches():
+    """Start every test with empty response caches."""
+    snapshots.get_snapshot_ticker.cache.clear()
+    snapshots.get_snapshot_all.cache.clear()
+    snapshots._negative_cache.clear()
+
+
+def create_mock_response(list_key, tickers):
+    """Create a mock raw response with one record per ticker."""
+    response = Mock()
+    data = {
+        list_key: [{"ticker": t, "value": i} for i, t in enumerate(tickers)],
+        "status": "OK",
+        "count": len(tickers),
+    }
+    response.data = json.dumps(data).encode("utf-8")
+    return response
+
+
+@pytest.mark.asyncio
+async def test_fetch_ticker_chunks_merges_in_order():
+    """Test that long ticker lists are split and merged in order."""
+    tickers = [f"T{i:03d}" for i in range(120)]
+
+    def fake_get_snapshot_all(tickers, **kwargs):
+        return create_mock_response("tickers", tickers)
+
+    with patch.object(
+        polygon_client, "get_snapshot_all", side_effect=fake_get_snapshot_all
+    ) as mock_call:
+        merged = await snapshots._fetch_ticker_chunks(
+            polygon_client.get_snapshot_all,
+            "tickers",
+            tickers,
+            market_type="stocks",
+        )
+
+    assert mock_call.call_count == 3
+    assert [r["ticker"] for r in merged["tickers"]] == tickers
+    assert merged["count"] == 120
+
+
+@pytest.mark.asyncio
+async def test_fetch_ticker_chunks_sends_each_chunk_its_own_tickers():
+    """Test that concurrent chunks never share the SDK's mutable params dict."""
+    tickers = [f"T{i:03d}" for i in range(200)]
+    params = {"order": "asc"}
+    sent = []
+
+    def fake_get(path, params, **kwargs):
+        time.sleep(0.01)
+        sent.append(params["ticker.any_of"])
+        return create_mock_response("results", params["ticker.any_of"].split(","))
+
+    with patch.object(polygon_client, "_get", side_effect=fake_get):
+        merged = await snapshots._fetch_ticker_chunks(
+            polygon_client.list_universal_snapshots,
+            "ticker_any_of",
+            tickers,
+            params=params,
+        )
+
+    expected = {
+        ",".join(tickers[i : i + snapshots.TICKER_CHUNK_SIZE])
+        for i in range(0, len(tickers), snapshots.TICKER_CHUNK_SIZE)
+    }
+    assert set(sent) == expected
+    assert [r["ticker"] for r in merged["results"]] == tickers
+    assert params == {"order": "asc"}
+
+
+@pytest.mark.asyncio
+async def test_list_universal_snapshots_single_page_chunks():
+    """Test the single-page path fans out long ticker_any_of lists."""
+    tickers = [f"T{i:03d}" for i in range(75)]
+
+    def fake_list(ticker_any_of, **kwargs):
+        return create_mock_response("results", ticker_any_of)
+
+    with (
+        patch.object(
+            polygon_client, "list_universal_snapshots", side_effect=fake_list
+        ) as mock_call,
+        patch.object(snapshots, "process_tool_response") as mock_process,
+    ):
+
+        async def passthrough(tool_name, params, csv_data):
+            return csv_data
+
+        mock_process.side_effect = passthrough
+        result = await snapshots.list_universal_snapshots(
+            ticker_any_of=tickers, limit=250, fetch_all=False
+        )
+
+    assert mock_call.call_count == 2
+    lines = result.strip().split("\n")
+    assert lines[0] == "ticker,value"
+    assert len(lines) == 76
+    assert lines[1].startswith("T000") and lines[-1].startswith("T074")
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_all_returns_row_per_ticker():
+    """Test that the full-market snapshot renders one CSV row per ticker."""
+    with (
+        patch.object(
+            polygon_client,
+            "get_snapshot_all",
+            return_value=create_mock_response("tickers", ["AAPL", "MSFT"]),
+        ),
+        patch.object(snapshots, "process_tool_response") as mock_process,
+    ):
+
+        async def passthrough(tool_name, params, csv_data):
+            return csv_data
+
+        mock_process.side_effect = passthrough
+        result = await snapshots.get_snapshot_all("stocks")
+
+    assert result == "ticker,value\nAAPL,0\nMSFT,1\n"
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_option_renders_results_object():
+    """Test that the single option snapshot object becomes one CSV row."""
+    response = Mock()
+    response.data = json.dumps(
+        {
+            "status": "OK",
+            "results": {"greeks": {"delta": 0.5}, "implied_volatility": 0.3},
+        }
+    ).encode("utf-8")
+
+    with patch.object(polygon_client, "get_snapshot_option", return_value=response):
+        result = await snapshots.get_snapshot_option("AAPL", "O:AAPL251219C00150000")
+
+    assert result == "greeks_delta,implied_volatility\n0.5,0.3\n"
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_batches_concurrent_calls():
+    """Test that concurrent single-ticker lookups share one request."""
+
+    response = create_mock_response("tickers", ["AAPL", "MSFT", "TSLA"])
+
+    with (
+        patch.object(
+            polygon_client, "get_snapshot_all", return_value=response
+        ) as mock_all,
+        patch.object(polygon_client, "get_snapshot_ticker") as mock_single,
+    ):
+        results = await asyncio.gather(
+            snapshots.get_snapshot_ticker("AAPL"),
+            snapshots.get_snapshot_ticker("msft"),
+            snapshots.get_snapshot_ticker("TSLA"),
+        )
+
+    mock_single.assert_not_called()
+    mock_all.assert_called_once()
+    assert sorted(mock_all.call_args.kwargs["tickers"]) == ["AAPL", "MSFT", "TSLA"]
+    assert results[0] == "ticker_ticker,ticker_value,status\nAAPL,0,OK\n"
+    assert results[1] == "ticker_ticker,ticker_value,status\nMSFT,1,OK\n"
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_lone_call_uses_single_endpoint():
+    """Test that a lookup with no other lookup in its window is not rerouted."""
+    response = Mock()
+    response.data = json.dumps(
+        {"ticker": {"ticker": "AAPL", "value": 1}, "status": "OK"}
+    ).encode("utf-8")
+
+    with (
+        patch.object(
+            polygon_client, "get_snapshot_ticker", return_value=response
+        ) as mock_single,
+        patch.object(polygon_client, "get_snapshot_all") as mock_all,
+    ):
+        result = await snapshots.get_snapshot_ticker("AAPL")
+
+    mock_all.assert_not_called()
+    mock_single.assert_called_once()
+    assert result == "ticker_ticker,ticker_value,status\nAAPL,1,OK\n"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_batcher_sends_lone_lookup_without_waiting():
+    """Test that a lookup with no concurrent company skips the batch window."""
+    batcher = snapshots.SnapshotBatcher(window_ms=10_000)
+    response = Mock()
+    response.data = json.dumps(
+        {"ticker": {"ticker": "AAPL", "value": 1}, "status": "OK"}
+    ).encode("utf-8")
+
+    with patch.object(polygon_client, "get_snapshot_ticker", return_value=response):
+        future = await batcher.submit("AAPL")
+        result = await asyncio.wait_for(future, timeout=1)
+
+    assert result == "ticker_ticker,ticker_value,status\nAAPL,1,OK\n"
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_batch_retries_omitted_ticker():
+    """Test that a ticker absent from the batch response is fetched on its own."""
+    batch = create_mock_response("tickers", ["AAPL"])
+    single = Mock()
+    single.data = json.dumps(
+        {"ticker": {"ticker": "GBTC", "value": 7}, "status": "OK"}
+    ).encode("utf-8")
+
+    with (
+        patch.object(
+            polygon_client, "get_snapshot_all", return_value=batch
+        ) as mock_all,
+        patch.object(
+            polygon_client, "get_snapshot_ticker", return_value=single
+        ) as mock_single,
+    ):
+        found, omitted = await asyncio.gather(
+            snapshots.get_snapshot_ticker("AAPL"),
+            snapshots.get_snapshot_ticker("GBTC"),
+        )
+
+    assert "include_otc" not in mock_all.call_args.kwargs
+    mock_single.assert_called_once()
+    assert mock_single.call_args.kwargs["ticker"] == "GBTC"
+    assert found == "ticker_ticker,ticker_value,status\nAAPL,0,OK\n"
+    assert omitted == "ticker_ticker,ticker_value,status\nGBTC,7,OK\n"
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_batch_reports_single_endpoint_error():
+    """Test that an omitted ticker surfaces the single-ticker endpoint's error."""
+    batch = create_mock_response("tickers", ["AAPL"])
+    error = BadResponse('{"status":"NOT_FOUND","message":"Ticker not found."}')
+
+    with (
+        patch.object(polygon_client, "get_snapshot_all", return_value=batch),
+        patch.object(polygon_client, "get_snapshot_ticker", side_effect=error),
+    ):
+        found, missing = await asyncio.gather(
+            snapshots.get_snapshot_ticker("AAPL"),
+            snapshots.get_snapshot_ticker("ZZZZ"),
+        )
+
+    assert found.startswith("ticker_ticker,ticker_value,status")
+    assert missing.startswith("Error: ") and "NOT_FOUND" in missing
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_caches_not_found():
+    """Test that a NOT_FOUND verdict is served from cache on retry."""
+    error = BadResponse('{"status":"NOT_FOUND","message":"Ticker not found."}')
+
+    with patch.object(
+        polygon_client, "get_snapshot_ticker", side_effect=error
+    ) as mock_single:
+        first = await snapshots.get_snapshot_ticker("NOPE")
+        second = await snapshots.get_snapshot_ticker("nope")
+
+    assert mock_single.call_count == 1
+    assert first == second
+    assert "NOT_FOUND" in first
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_batch_not_found_is_not_cached():
+    """Test that a multi-ticker NOT_FOUND never blacklists a valid symbol."""
+    error = BadResponse('{"status":"NOT_FOUND","message":"Tickers not found."}')
+    single = Mock()
+    single.data = json.dumps(
+        {"ticker": {"ticker": "GBTC", "value": 7}, "status": "OK"}
+    ).encode("utf-8")
+
+    with (
+        patch.object(polygon_client, "get_snapshot_all", side_effect=error),
+        patch.object(
+            polygon_client, "get_snapshot_ticker", return_value=single
+        ) as mock_single,
+    ):
+        results = await asyncio.gather(
+            snapshots.get_snapshot_ticker("GBTC"),
+            snapshots.get_snapshot_ticker("OTCM"),
+        )
+
+    assert mock_single.call_count == 2
+    assert all(
+        result.startswith("ticker_ticker,ticker_value,status") for result in results
+    )
+    assert len(snapshots._negative_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_option_does_not_cache_transient_errors():
+    """Test that server errors are retried rather than negatively cached."""
+    error = BadResponse('{"status":"ERROR","message":"Internal server error"}')
+
+    with patch.object(
+        polygon_client, "get_snapshot_option", side_effect=error
+    ) as mock_option:
+        await snapshots.get_snapshot_option("AAPL", "O:AAPL251219C00150000")
+        await snapshots.get_snapshot_option("AAPL", "O:AAPL251219C00150000")
+
+    assert mock_option.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_all_arrow_format():
+    """Test that format="arrow" returns a decodable IPC stream."""
+    with (
+        patch.object(
+            polygon_client,
+            "get_snapshot_all",
+            return_value=create_mock_response("tickers", ["AAPL", "MSFT"]),
+        ),
+        patch.object(snapshots, "process_tool_response") as mock_process,
+    ):
+        result = await snapshots.get_snapshot_all("stocks", format="arrow")
+
+    mock_process.assert_not_called()
+    table = pa_ipc.open_stream(base64.b64decode(result)).read_all()
+    assert table.column("ticker").to_pylist() == ["AAPL", "MSFT"]
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_serves_repeat_calls_from_cache():
+    """Test that re-querying a symbol within the TTL skips the API."""
+    response = Mock()
+    response.data = json.dumps(
+        {"ticker": {"ticker": "AAPL", "value": 1}, "status": "OK"}
+    ).encode("utf-8")
+
+    with patch.object(
+        polygon_client, "get_snapshot_ticker", return_value=response
+    ) as mock_single:
+        first = await snapshots.get_snapshot_ticker("AAPL")
+        second = await snapshots.get_snapshot_ticker("AAPL")
+
+    assert first == second
+    mock_single.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_ticker_coalesces_identical_concurrent_calls():
+    """Test that simultaneous lookups of one symbol make one request."""
+    response = Mock()
+    response.data = json.dumps(
+        {"ticker": {"ticker": "AAPL", "value": 1}, "status": "OK"}
+    ).encode("utf-8")
+
+    with (
+        patch.object(
+            polygon_client, "get_snapshot_ticker", return_value=response
+        ) as mock_single,
+        patch.object(polygon_client, "get_snapshot_all") as mock_all,
+    ):
+        results = await asyncio.gather(
+            *(snapshots.get_snapshot_ticker(t) for t in ["AAPL"] * 5 + ["aapl"] * 5)
+        )
+
+    mock_all.assert_not_called()
+    mock_single.assert_called_once()
+    assert len(set(results)) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_direction_rejects_bad_arguments_locally():
+    """Test that typos fail without a request to Polygon."""
+    with patch.object(polygon_client, "get_snapshot_direction") as mock_call:
+        bad_direction = await snapshots.get_snapshot_direction("stocks", "gainer")
+        bad_market = await snapshots.get_snapshot_direction("stock", "gainers")
+
+    mock_call.assert_not_called()
+    assert bad_direction.startswith("Error: direction must be")
+    assert bad_market.startswith("Error: market_type must be one of")
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_all_json_format_passes_response_through():
+    """Test that format="json" returns the API payload without conversion."""
+    response = create_mock_response("tickers", ["AAPL"])
+
+    with patch.object(polygon_client, "get_snapshot_all", return_value=response):
+        result = await snapshots.get_snapshot_all("stocks", format="json")
+
+    assert result == response.data.decode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_all_rejects_unknown_format():
+    """Test that an unsupported format fails without a request to Polygon."""
+    with patch.object(polygon_client, "get_snapshot_all") as mock_call:
+        result = await snapshots.get_snapshot_all("stocks", format="parquet")
+
+    mock_call.assert_not_called()
+    assert result == "Error: format must be one of csv, arrow, json, got 'parquet'"
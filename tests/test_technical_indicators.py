@@ -0,0 +1,256 @@
+"""Test the combined technical indicator tool."""
+
+import asyncio
+import json
+from datetime import date, datetime, timezone
+from unittest.mock import Mock, patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from mcp_polygon.cache_manager import CacheManager
+from mcp_polygon.tools import technical_indicators
+
+
+@pytest.fixture(autouse=True)
+def clear_indicator_caches():
+    """Start every test with empty indicator caches."""
+    for tool in ("get_sma", "get_ema", "get_macd", "get_rsi"):
+        getattr(technical_indicators, tool).cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_indicators_bundle_runs_concurrently():
+    """Test that the four indicators are fetched in parallel and sectioned."""
+    started = []
+    fetch_all = []
+    release = asyncio.Event()
+
+    def fake_indicator(name):
+        async def indicator(ticker, **kwargs):
+            started.append(name)
+            fetch_all.append(kwargs["fetch_all"])
+            if len(started) == 4:
+                release.set()
+            # Only completes once all four have started
+            await asyncio.wait_for(release.wait(), timeout=1)
+            return f"timestamp,value\n1,{name}\n"
+
+        return indicator
+
+    with (
+        patch.object(technical_indicators, "get_sma", fake_indicator("sma")),
+        patch.object(technical_indicators, "get_ema", fake_indicator("ema")),
+        patch.object(technical_indicators, "get_macd", fake_indicator("macd")),
+        patch.object(technical_indicators, "get_rsi", fake_indicator("rsi")),
+    ):
+        result = await technical_indicators.get_indicators_bundle("AAPL")
+
+    assert sorted(started) == ["ema", "macd", "rsi", "sma"]
+    # Same default as calling the indicator tools one by one
+    assert fetch_all == [True] * 4
+    assert result == (
+        "## SMA\ntimestamp,value\n1,sma\n\n"
+        "## EMA\ntimestamp,value\n1,ema\n\n"
+        "## MACD\ntimestamp,value\n1,macd\n\n"
+        "## RSI\ntimestamp,value\n1,rsi\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_single_page_forwards_indicator_arguments():
+    """Test the fetch_all=False path sends limit, filters and raw to the SDK."""
+    response = Mock()
+    response.data = json.dumps(
+        {"results": {"values": [{"timestamp": 1, "value": 2.5}]}}
+    ).encode("utf-8")
+
+    with (
+        patch.object(
+            technical_indicators.polygon_client, "get_rsi", return_value=response
+        ) as mock_rsi,
+        patch.object(technical_indicators, "process_tool_response") as mock_process,
+    ):
+
+        async def passthrough(tool_name, params, csv_data, **kwargs):
+            return csv_data
+
+        mock_process.side_effect = passthrough
+        result = await technical_indicators.get_rsi(
+            "AAPL", window=7, limit=5, fetch_all=False, timestamp_gte="2025-01-01"
+        )
+
+    assert result == "timestamp,value\n1,2.5\n"
+    kwargs = mock_rsi.call_args.kwargs
+    assert kwargs["window"] == 7
+    assert kwargs["limit"] == 5
+    assert kwargs["raw"] is True
+    assert kwargs["params"] == {"timestamp.gte": "2025-01-01"}
+    assert "timestamp" not in kwargs
+
+
+def test_indicator_ttl_follows_timespan():
+    """Test that minute bars expire sooner than daily bars."""
+    ttl = technical_indicators.INDICATOR_TTL
+    assert ttl({"timespan": "minute"}) < ttl({"timespan": "day"})
+    assert ttl({"timespan": "week"}) == ttl({"timespan": "day"})
+
+
+@pytest.mark.asyncio
+async def test_repeat_indicator_call_skips_api():
+    """Test that an identical call within the TTL is served from cache."""
+    response = Mock()
+    response.data = json.dumps(
+        {"results": {"values": [{"timestamp": 1, "value": 50.0}]}}
+    ).encode("utf-8")
+
+    with (
+        patch.object(
+            technical_indicators.polygon_client, "get_sma", return_value=response
+        ) as mock_sma,
+        patch.object(technical_indicators, "process_tool_response") as mock_process,
+    ):
+
+        async def passthrough(tool_name, params, csv_data, **kwargs):
+            return csv_data
+
+        mock_process.side_effect = passthrough
+        first = await technical_indicators.get_sma("AAPL", window=20, fetch_all=False)
+        second = await technical_indicators.get_sma("AAPL", window=20, fetch_all=False)
+        other = await technical_indicators.get_sma("AAPL", window=50, fetch_all=False)
+
+    assert first == second == other
+    assert mock_sma.call_count == 2
+
+
+def test_cached_batches_use_indicator_schema(tmp_path):
+    """Test that cached MACD batches store numbers, not strings."""
+    cache_mgr = CacheManager(cache_dir=str(tmp_path / "cache"))
+    csv_data = (
+        "timestamp,value,signal,histogram\n"
+        "1704067200000,1.5,1.25,0.25\n"
+        "1704153600000,1.75,,0.5\n"
+    )
+
+    files = cache_mgr.save_batch(
+        tool_name="get_macd",
+        params={"ticker": "AAPL", "fetch_all": True},
+        csv_data=csv_data,
+        batch_num=0,
+        schema=technical_indicators.INDICATOR_SCHEMA,
+    )
+
+    table = pa.concat_tables(pq.read_table(f) for f in files)
+    assert table.schema.field("timestamp").type == pa.int64()
+    assert table.schema.field("value").type == pa.float64()
+    assert table.schema.field("signal").type == pa.float64()
+    assert sorted(table.column("signal").to_pylist(), key=str) == [1.25, None]
+
+
+def test_indicator_schema_keeps_missing_timestamps_null():
+    """Test that a gap in an int64 column becomes null without losing precision."""
+    rows = [
+        {"timestamp": "1704067200000000001", "value": "1.5"},
+        {"timestamp": "", "value": "1.75"},
+    ]
+
+    table = CacheManager._to_table(rows, technical_indicators.INDICATOR_SCHEMA)
+
+    assert table.schema.field("timestamp").type == pa.int64()
+    assert table.column("timestamp").to_pylist() == [1704067200000000001, None]
+    assert table.column("value").to_pylist() == [1.5, 1.75]
+
+
+@pytest.mark.asyncio
+async def test_invalid_arguments_fail_without_request():
+    """Test that typos are rejected locally and oversize limits are clamped."""
+    response = Mock()
+    response.data = json.dumps({"results": {"values": []}}).encode("utf-8")
+
+    with (
+        patch.object(
+            technical_indicators.polygon_client, "get_ema", return_value=response
+        ) as mock_ema,
+        patch.object(technical_indicators, "process_tool_response") as mock_process,
+    ):
+
+        async def passthrough(tool_name, params, csv_data, **kwargs):
+            return csv_data
+
+        mock_process.side_effect = passthrough
+        bad_timespan = await technical_indicators.get_ema("AAPL", timespan="days")
+        bad_order = await technical_indicators.get_ema("AAPL", order="descending")
+        mock_ema.assert_not_called()
+
+        await technical_indicators.get_ema("AAPL", limit=10000, fetch_all=False)
+
+    assert bad_timespan.startswith("Error: timespan must be one of")
+    assert bad_order.startswith("Error: order must be one of")
+    assert mock_ema.call_args.kwargs["limit"] == 5000
+
+
+@pytest.mark.asyncio
+async def test_get_indicators_bundle_subset():
+    """Test that only the requested indicators are fetched."""
+    called = []
+
+    def fake_indicator(name):
+        async def indicator(ticker, **kwargs):
+            called.append(name)
+            return f"timestamp,value\n1,{name}\n"
+
+        return indicator
+
+    with (
+        patch.object(technical_indicators, "get_sma", fake_indicator("sma")),
+        patch.object(technical_indicators, "get_ema", fake_indicator("ema")),
+        patch.object(technical_indicators, "get_macd", fake_indicator("macd")),
+        patch.object(technical_indicators, "get_rsi", fake_indicator("rsi")),
+    ):
+        result = await technical_indicators.get_indicators_bundle(
+            "AAPL", indicators=["RSI", "macd", "rsi"]
+        )
+        unknown = await technical_indicators.get_indicators_bundle(
+            "AAPL", indicators=["vwap"]
+        )
+
+    assert called == ["rsi", "macd"]
+    assert result == (
+        "## RSI\ntimestamp,value\n1,rsi\n\n## MACD\ntimestamp,value\n1,macd\n"
+    )
+    assert unknown.startswith("Error: unknown indicator(s) vwap")
+
+
+@pytest.mark.asyncio
+async def test_date_arguments_sent_in_polygon_form():
+    """Test that date and datetime filters become ISO dates and Unix ms."""
+    response = Mock()
+    response.data = json.dumps({"results": {"values": []}}).encode("utf-8")
+    moment = datetime(2024, 1, 2, 15, 30, tzinfo=timezone.utc)
+
+    with (
+        patch.object(
+            technical_indicators.polygon_client, "get_sma", return_value=response
+        ) as mock_sma,
+        patch.object(technical_indicators, "process_tool_response") as mock_process,
+    ):
+
+        async def passthrough(tool_name, params, csv_data, **kwargs):
+            return csv_data
+
+        mock_process.side_effect = passthrough
+        await technical_indicators.get_sma(
+            "AAPL",
+            timestamp=moment,
+            timestamp_gte=date(2024, 1, 1),
+            timestamp_lt=moment,
+            fetch_all=False,
+        )
+
+    kwargs = mock_sma.call_args.kwargs
+    assert kwargs["timestamp"] == 1704209400000
+    assert kwargs["params"] == {
+        "timestamp.gte": "2024-01-01",
+        "timestamp.lt": 1704209400000,
+    }
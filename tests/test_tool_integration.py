@@ -0,0 +1,77 @@
+"""Test the CSV helpers used when deciding how to return tool responses."""
+
+import threading
+
+import pytest
+
+from mcp_polygon import tool_integration
+from mcp_polygon.cache_manager import CacheManager
+from mcp_polygon.tool_integration import (
+    _extract_columns,
+    _iter_lines,
+    _parse_csv_sample,
+    create_batch_writer,
+)
+
+
+class TestIterLines:
+    """Test lazy line splitting."""
+
+    def test_keeps_line_endings(self):
+        """Test that lines match splitlines(keepends=True)."""
+        text = "a,b\n1,2\n3,4"
+        assert list(_iter_lines(text)) == text.splitlines(keepends=True)
+
+    def test_empty(self):
+        """Test that an empty string yields nothing."""
+        assert list(_iter_lines("")) == []
+
+
+class TestCsvSampling:
+    """Test header and sample-row extraction."""
+
+    def test_extract_columns(self):
+        """Test that the header row becomes the column list."""
+        assert _extract_columns("ticker,c\nAAPL,1\n") == ["ticker", "c"]
+
+    def test_blank_input(self):
+        """Test that blank CSV has no columns or rows."""
+        assert _extract_columns(" \n") == []
+        assert _parse_csv_sample("") == []
+
+    def test_sample_handles_quoted_newlines(self):
+        """Test that a quoted field spanning lines stays one row."""
+        csv_data = 'ticker,name\nAAPL,"Apple\nInc"\nMSFT,Microsoft\nTSLA,Tesla\n'
+        rows = _parse_csv_sample(csv_data, n=2)
+        assert rows == [
+            {"ticker": "AAPL", "name": "Apple\nInc"},
+            {"ticker": "MSFT", "name": "Microsoft"},
+        ]
+
+
+class TestBatchWriter:
+    """Test streaming batch writes."""
+
+    @pytest.mark.asyncio
+    async def test_writes_off_event_loop(self, tmp_path, monkeypatch):
+        """Test that batches are encoded and written outside the loop thread."""
+        cache_mgr = CacheManager(cache_dir=str(tmp_path / "cache"))
+        writer_threads = []
+        save_batch = cache_mgr.save_batch
+
+        def recording_save_batch(**kwargs):
+            writer_threads.append(threading.current_thread())
+            return save_batch(**kwargs)
+
+        monkeypatch.setattr(cache_mgr, "save_batch", recording_save_batch)
+        monkeypatch.setattr(tool_integration, "get_cache_manager", lambda: cache_mgr)
+
+        batch_callback, finalize = create_batch_writer(
+            "get_sma", {"ticker": "AAPL", "fetch_all": True}
+        )
+        await batch_callback(0, [{"timestamp": 1704067200000, "value": 1.5}])
+        await batch_callback(1, [{"timestamp": 1704153600000, "value": 1.75}])
+        await finalize()
+
+        assert len(writer_threads) == 2
+        assert threading.main_thread() not in writer_threads
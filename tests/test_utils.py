@@ -0,0 +1,116 @@
+"""Test shared tool utilities."""
+
+import asyncio
+import threading
+import time
+from datetime import date, datetime
+
+import pytest
+
+from mcp_polygon import utils
+from mcp_polygon.utils import call_polygon, chunked, normalize_date
+
+
+class TestChunked:
+    """Test splitting sequences into fixed-size slices."""
+
+    def test_splits_with_short_tail(self):
+        """Test that the last slice holds the remainder."""
+        assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    def test_empty_sequence(self):
+        """Test that an empty sequence yields no slices."""
+        assert chunked([], 50) == []
+
+
+class TestNormalizeDate:
+    """Test canonicalization of date-like tool arguments."""
+
+    def test_strings_pass_through(self):
+        """Test that date strings are returned unchanged."""
+        assert normalize_date("2024-01-02") == "2024-01-02"
+
+    def test_integers_pass_through(self):
+        """Test that Unix ms timestamps are returned unchanged."""
+        assert normalize_date(1704153600000) == 1704153600000
+
+    def test_none_passes_through(self):
+        """Test that None is returned unchanged."""
+        assert normalize_date(None) is None
+
+    def test_date_becomes_iso_string(self):
+        """Test that date objects become YYYY-MM-DD strings."""
+        assert normalize_date(date(2024, 1, 2)) == "2024-01-02"
+
+    def test_datetime_becomes_ms_timestamp(self):
+        """Test that datetimes become Unix ms timestamps like the SDK sends."""
+        value = datetime(2024, 1, 2, 9, 30)
+        assert normalize_date(value) == int(value.timestamp() * 1000)
+
+
+class TestCallPolygon:
+    """Test bounded, off-loop dispatch of Polygon SDK calls."""
+
+    @pytest.mark.asyncio
+    async def test_forwards_arguments_and_result(self):
+        """Test that args/kwargs reach the method and its result is returned."""
+
+        def method(a, b=None):
+            return (a, b)
+
+        assert await call_polygon(method, 1, b=2) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop_thread(self):
+        """Test that the blocking call runs in a worker thread."""
+        loop_thread = threading.get_ident()
+        call_thread = await call_polygon(threading.get_ident)
+        assert call_thread != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_uses_polygon_pool(self):
+        """Test that calls run on the pool sized to the in-flight limit."""
+        name = await call_polygon(lambda: threading.current_thread().name)
+        assert name.startswith("polygon")
+        assert utils._polygon_executor._max_workers == utils.POLYGON_MAX_INFLIGHT
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_calls(self, monkeypatch):
+        """Test that no more than the semaphore limit run at once."""
+        monkeypatch.setattr(utils, "POLYGON_MAX_INFLIGHT", 2)
+        utils._polygon_semaphores.clear()
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def method():
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+
+        await asyncio.gather(*(call_polygon(method) for _ in range(6)))
+        assert state["peak"] == 2
+
+    def test_limiter_works_across_event_loops(self, monkeypatch):
+        """Test that contended calls still run after the event loop changes."""
+        monkeypatch.setattr(utils, "POLYGON_MAX_INFLIGHT", 1)
+
+        async def contended():
+            calls = (call_polygon(time.sleep, 0.01) for _ in range(3))
+            return await asyncio.gather(*calls)
+
+        # A semaphore shared between loops raises once the second one waits
+        assert asyncio.run(contended()) == [None] * 3
+        assert asyncio.run(contended()) == [None] * 3
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self):
+        """Test that SDK errors reach the tool's error handler."""
+
+        def method():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await call_polygon(method)